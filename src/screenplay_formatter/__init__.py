@@ -2,9 +2,19 @@
 
 __version__ = "1.0.0"
 
+import importlib
+
 from .parser import ScreenplayParser, ElementType
-from .formatter import TextFormatter, DocxFormatter, PdfFormatter
-from .validator import ScreenplayValidator, ValidationError
+
+# Formatters pull in python-docx and reportlab, and the validator pulls in
+# pydantic, so they are only imported on first access
+_LAZY_IMPORTS = {
+    "TextFormatter": ".formatter",
+    "DocxFormatter": ".formatter",
+    "PdfFormatter": ".formatter",
+    "ScreenplayValidator": ".validator",
+    "ValidationError": ".validator",
+}
 
 __all__ = [
     "ScreenplayParser",
@@ -14,4 +24,14 @@ __all__ = [
     "PdfFormatter",
     "ScreenplayValidator",
     "ValidationError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
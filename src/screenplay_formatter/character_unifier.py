@@ -1,18 +1,26 @@
 """Character name unification utility for screenplays."""
 
+import io
 import re
-from typing import List, Dict, Tuple, Optional, Set
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Set, FrozenSet
+from dataclasses import dataclass, replace
 from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
 from .parser import ScreenplayElement, ElementType
 
 
-@dataclass
+# Trailing extension such as (O.S.), (V.O.), (CONT'D)
+CHARACTER_EXTENSION_PATTERN = re.compile(r'\s*(\([^)]+\))\s*$')
+
+
+@dataclass(slots=True, frozen=True)
 class CharacterVariant:
     """Represents a variant of a character name."""
     canonical: str  # The canonical (preferred) form
-    variants: Set[str]  # All variations found
+    variants: FrozenSet[str]  # All variations found
     occurrences: int  # Total number of appearances
     line_numbers: List[int]  # Where each variant appears
 
@@ -23,6 +31,8 @@ class CharacterNameUnifier:
     def __init__(self):
         """Initialize character name unifier."""
         self.character_map: Dict[str, CharacterVariant] = {}
+        self._variant_to_canonical: Dict[str, str] = {}  # Uppercased variant -> canonical
+        self._analyzed = False
 
     def analyze_characters(self, elements: List[ScreenplayElement]) -> Dict[str, CharacterVariant]:
         """
@@ -34,84 +44,126 @@ class CharacterNameUnifier:
         Returns:
             Dictionary mapping canonical names to CharacterVariant objects
         """
-        # First pass: collect all character names
-        character_instances = defaultdict(list)
+        # First pass: collect a (name_upper, line_number, form) row per character line
+        rows = []
 
         for element in elements:
             if element.type == ElementType.CHARACTER:
                 # Strip extensions like (O.S.), (V.O.), (CONT'D)
-                base_name = self._extract_base_name(element.content)
-                base_name_upper = base_name.upper()
+                base_name, _ = self._split_name_extensions(element.content)
+                rows.append((base_name.upper(), element.line_number, base_name))
+
+        # Nothing to group when the screenplay has no character names
+        if not rows:
+            self.character_map = {}
+            self._variant_to_canonical = {}
+            self._analyzed = True
+            return self.character_map
+
+        # Group (line_number, form) instances by uppercased name with a single sort
+        rows.sort()
+        character_instances: Dict[str, List[Tuple[int, str]]] = {
+            name: [(line, form) for _, line, form in group]
+            for name, group in groupby(rows, key=itemgetter(0))
+        }
 
-                character_instances[base_name_upper].append({
-                    'line': element.line_number,
-                    'form': base_name
-                })
+        # Second pass: merge related names (e.g., JESS and JESSICA). Each group is
+        # seeded by its longest name, which becomes the canonical form, and only takes
+        # names related to that seed, so JESSICA and JESSIE don't merge through JESS
+        first_line = {name: instances[0][0] for name, instances in character_instances.items()}
+        names = sorted(character_instances, key=first_line.get)
+
+        related: Dict[str, Set[str]] = defaultdict(set)
+        for name, other_name in self._find_related_pairs(names):
+            related[name].add(other_name)
+            related[other_name].add(name)
+
+        groups: List[List[str]] = []
+        grouped: Set[str] = set()
+        for name in sorted(names, key=lambda name: (-len(name), first_line[name])):
+            if name in grouped:
+                continue
+            group = [name] + sorted(related[name] - grouped, key=first_line.get)
+            grouped.update(group)
+            groups.append(group)
 
-        # Second pass: group related names and identify canonical form
+        # Keep groups in order of first appearance
+        groups.sort(key=lambda group: min(first_line[name] for name in group))
+
+        # Third pass: build one CharacterVariant per group
         self.character_map = {}
-        processed_names = set()
+        self._variant_to_canonical = {}
 
-        for canonical_name, instances in character_instances.items():
-            if canonical_name in processed_names:
-                continue
+        for group in groups:
+            instances = [inst for name in group for inst in character_instances[name]]
 
             # Collect all variants
-            variants = set(inst['form'] for inst in instances)
-            line_numbers = [inst['line'] for inst in instances]
-
-            # Check for related names (e.g., JESS and JESSICA)
-            related_names = self._find_related_names(canonical_name, character_instances.keys())
-
-            # Merge related names
-            for related in related_names:
-                if related != canonical_name and related not in processed_names:
-                    variants.update(inst['form'] for inst in character_instances[related])
-                    line_numbers.extend(inst['line'] for inst in character_instances[related])
-                    processed_names.add(related)
+            variants = set(form for _, form in instances)
+            line_numbers = [line for line, _ in instances]
 
             # Determine canonical form (prefer full name or most common form)
             canonical_form = self._determine_canonical_form(variants)
 
             self.character_map[canonical_form] = CharacterVariant(
                 canonical=canonical_form,
-                variants=variants,
+                variants=frozenset(variants),
                 occurrences=len(line_numbers),
                 line_numbers=sorted(line_numbers)
             )
 
-            processed_names.add(canonical_name)
+            # Group keys are already uppercased variants
+            for name in group:
+                self._variant_to_canonical[name] = canonical_form
 
+        self._analyzed = True
         return self.character_map
 
-    def _extract_base_name(self, character_line: str) -> str:
-        """Extract base character name without extensions."""
-        # Remove (O.S.), (V.O.), (CONT'D), etc.
-        base_name = re.sub(r'\s*\([^)]+\)\s*$', '', character_line)
-        return base_name.strip()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _split_name_extensions(character_line: str) -> Tuple[str, str]:
+        """
+        Split a character line into its base name and extensions.
+
+        Character lines repeat heavily within a screenplay, so results are cached.
 
-    def _find_related_names(self, name: str, all_names: List[str]) -> List[str]:
+        Returns:
+            Tuple of (base_name, extensions), e.g. ("JOHN", " (O.S.)")
         """
-        Find character names that might be variations of the same character.
+        match = CHARACTER_EXTENSION_PATTERN.search(character_line)
+        if match:
+            return character_line[:match.start()].strip(), ' ' + match.group(1)
+        return character_line.strip(), ''
+
+    def _find_related_pairs(self, names: List[str]) -> List[Tuple[str, str]]:
+        """
+        Find pairs of character names that might be variations of the same character.
 
         Examples:
             JESS and JESSICA
             MIKE and MICHAEL
             BOB and ROBERT
+
+        Names are indexed by their 3-character substrings so each name is only
+        compared against the names that could contain it.
         """
-        related = []
+        trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        for name in names:
+            for i in range(len(name) - 2):
+                trigram_index[name[i:i + 3]].add(name)
+
+        pairs = []
 
-        for other_name in all_names:
-            if other_name == name:
+        for name in names:
+            # Related names must share at least 3 characters; when one name is a
+            # substring of the other, the shared characters are those of the shorter one
+            if len(set(name)) < 3:
                 continue
 
-            # Check if one name is substring of another
-            if name in other_name or other_name in name:
-                # Additional check: names should share at least 3 characters
-                if len(set(name) & set(other_name)) >= 3:
-                    related.append(other_name)
+            for other_name in trigram_index.get(name[:3], ()):
+                if other_name != name and name in other_name:
+                    pairs.append((name, other_name))
 
-        return related
+        return pairs
 
     def _determine_canonical_form(self, variants: Set[str]) -> str:
         """
@@ -122,6 +174,10 @@ class CharacterNameUnifier:
         2. All caps version
         3. First occurrence if tied
         """
+        # Most characters are named consistently: nothing to choose between
+        if len(variants) == 1:
+            return next(iter(variants))
+
         # Convert to list and sort by length (descending), then alphabetically
         sorted_variants = sorted(variants, key=lambda x: (-len(x), x))
 
@@ -143,48 +199,33 @@ class CharacterNameUnifier:
         Returns:
             Modified elements with unified character names
         """
-        # First analyze if not done yet
-        if not self.character_map:
+        # First analyze if not done yet (an empty character_map may still be analyzed)
+        if not self._analyzed:
             self.analyze_characters(elements)
 
-        # Create mapping from variant to canonical
-        variant_to_canonical = {}
-        for char_var in self.character_map.values():
-            for variant in char_var.variants:
-                variant_to_canonical[variant.upper()] = char_var.canonical
+        # Apply unification using the variant-to-canonical map built during analysis
+        variant_to_canonical = self._variant_to_canonical
+        return [self._unify_element(element, variant_to_canonical) for element in elements]
 
-        # Apply unification
-        unified_elements = []
-        for element in elements:
-            if element.type == ElementType.CHARACTER:
-                base_name = self._extract_base_name(element.content)
-
-                # Get canonical name
-                canonical = variant_to_canonical.get(base_name.upper(), base_name.upper())
-
-                # Reconstruct with extensions if present
-                extensions = self._extract_extensions(element.content)
-                new_content = canonical + extensions
-
-                # Create new element with unified name
-                unified_element = ScreenplayElement(
-                    type=element.type,
-                    content=new_content,
-                    line_number=element.line_number,
-                    raw_line=element.raw_line
-                )
-                unified_elements.append(unified_element)
-            else:
-                unified_elements.append(element)
+    def _unify_element(self, element: ScreenplayElement,
+                       variant_to_canonical: Dict[str, str]) -> ScreenplayElement:
+        """Return the element with its character name unified (unchanged elements are reused)."""
+        if element.type != ElementType.CHARACTER:
+            return element
 
-        return unified_elements
+        base_name, extensions = self._split_name_extensions(element.content)
 
-    def _extract_extensions(self, character_line: str) -> str:
-        """Extract extensions like (O.S.), (V.O.), (CONT'D)."""
-        match = re.search(r'\s*(\([^)]+\))\s*$', character_line)
-        if match:
-            return ' ' + match.group(1)
-        return ''
+        # Get canonical name
+        base_name_upper = base_name.upper()
+        canonical = variant_to_canonical.get(base_name_upper, base_name_upper)
+
+        # Reconstruct with extensions if present
+        new_content = canonical + extensions
+        if new_content == element.content:
+            return element
+
+        # Copy the element with the unified name, keeping all other fields
+        return replace(element, content=new_content)
 
     def get_unification_report(self) -> str:
         """
@@ -196,7 +237,9 @@ class CharacterNameUnifier:
         if not self.character_map:
             return "No character analysis performed yet."
 
-        lines = ["Character Name Unification Report", "=" * 50, ""]
+        buf = io.StringIO()
+        write = buf.write
+        write("Character Name Unification Report\n" + "=" * 50 + "\n")
 
         # Sort by occurrence count (descending)
         sorted_chars = sorted(
@@ -206,18 +249,15 @@ class CharacterNameUnifier:
         )
 
         for char in sorted_chars:
-            lines.append(f"Character: {char.canonical}")
-            lines.append(f"  Occurrences: {char.occurrences}")
+            write(f"\nCharacter: {char.canonical}\n  Occurrences: {char.occurrences}\n")
 
             if len(char.variants) > 1:
-                lines.append(f"  Variants found: {', '.join(sorted(char.variants))}")
-                lines.append(f"  → Will unify to: {char.canonical}")
+                write(f"  Variants found: {', '.join(sorted(char.variants))}\n"
+                      f"  → Will unify to: {char.canonical}\n")
             else:
-                lines.append("  No variants (consistent naming)")
-
-            lines.append("")
+                write("  No variants (consistent naming)\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def get_inconsistent_characters(self) -> Dict[str, CharacterVariant]:
         """
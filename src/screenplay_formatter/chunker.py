@@ -1,5 +1,9 @@
 """Chunking strategy for failed validation regions."""
 
+import bisect
+from collections import Counter
+from itertools import accumulate
+from operator import attrgetter
 from typing import List, Dict, Tuple, Set
 from dataclasses import dataclass
 
@@ -8,7 +12,14 @@ from .validator import ValidationError, ErrorCode
 from .llm_corrector import ChunkContext
 
 
-@dataclass
+# Element types that start a natural chunk boundary: scenes, transitions
+# and the start of dialogue blocks
+_BOUNDARY_TYPES = frozenset({
+    ElementType.SCENE_HEADING, ElementType.TRANSITION, ElementType.CHARACTER
+})
+
+
+@dataclass(slots=True, frozen=True)
 class ChunkBoundary:
     """Represents natural boundaries for chunking."""
     start_line: int
@@ -17,6 +28,14 @@ class ChunkBoundary:
     description: str
 
 
+@dataclass
+class ChunkIndex:
+    """Line lookup tables built once per screenplay and shared by all chunks."""
+    element_lines: List[int]  # 0-based line of each element, in element order
+    boundary_lines: List[int]  # Sorted 0-based lines of natural boundaries
+    non_blank_prefix: List[int]  # non_blank_prefix[i] = non-blank lines in text_lines[:i]
+
+
 class ValidationChunker:
     """Chunks validation errors into logical regions for LLM processing."""
 
@@ -43,7 +62,7 @@ class ValidationChunker:
             text_lines: Original text lines
 
         Returns:
-            List of chunk contexts for LLM processing
+            List of valid chunk contexts for LLM processing
         """
         if not errors:
             return []
@@ -51,11 +70,20 @@ class ValidationChunker:
         # Group errors by proximity
         error_groups = self._group_errors_by_proximity(errors)
 
-        # Create chunks for each error group
+        # Index lines once for all groups
+        index = ChunkIndex(
+            element_lines=[elem.line_number - 1 for elem in elements],
+            boundary_lines=self._build_boundary_index(elements),
+            non_blank_prefix=list(accumulate(
+                (1 if line.strip() else 0 for line in text_lines), initial=0
+            ))
+        )
+
+        # Create chunks for each error group, keeping only those worth sending to the LLM
         chunks = []
         for group in error_groups:
-            chunk = self._create_chunk_for_group(group, elements, text_lines)
-            if chunk:
+            chunk = self._create_chunk_for_group(group, elements, text_lines, index)
+            if chunk and self._is_valid_chunk(chunk):
                 chunks.append(chunk)
 
         return chunks
@@ -66,65 +94,67 @@ class ValidationChunker:
             return []
 
         # Sort errors by line number
-        sorted_errors = sorted(errors, key=lambda e: e.line_number)
+        sorted_errors = sorted(errors, key=attrgetter('line_number'))
 
         groups = []
-        current_group = [sorted_errors[0]]
-
-        for error in sorted_errors[1:]:
-            # If error is within reasonable distance, add to current group
-            last_error_line = current_group[-1].line_number
-            if error.line_number - last_error_line <= 8:  # Within 8 lines
-                current_group.append(error)
-            else:
-                # Start new group
+        current_group = []
+        last_error_line = sorted_errors[0].line_number
+
+        for error in sorted_errors:
+            line_number = error.line_number
+            # If error is beyond reasonable distance, start a new group
+            if line_number - last_error_line > 8:  # More than 8 lines apart
                 groups.append(current_group)
-                current_group = [error]
+                current_group = []
+            current_group.append(error)
+            last_error_line = line_number
 
         # Add the last group
-        if current_group:
-            groups.append(current_group)
+        groups.append(current_group)
 
         return groups
 
     def _create_chunk_for_group(self,
                                error_group: List[ValidationError],
                                elements: List[ScreenplayElement],
-                               text_lines: List[str]) -> ChunkContext:
+                               text_lines: List[str],
+                               index: ChunkIndex) -> ChunkContext:
         """Create a chunk context for a group of errors."""
         if not error_group:
             return None
 
-        # Find the range of lines affected
-        min_line = min(e.line_number for e in error_group)
-        max_line = max(e.line_number for e in error_group)
+        # Find the range of lines affected (groups are sorted by line number)
+        min_line = error_group[0].line_number
+        max_line = error_group[-1].line_number
 
         # Extend to natural boundaries
         start_line, end_line = self._find_natural_boundaries(
-            min_line, max_line, elements, text_lines
+            min_line, max_line, index.boundary_lines, text_lines
         )
 
-        # Extract chunk content
-        chunk_lines = text_lines[start_line:end_line + 1]
+        # Find elements within this chunk (elements are in line order)
+        lo = bisect.bisect_left(index.element_lines, start_line)
+        hi = bisect.bisect_right(index.element_lines, end_line)
+        chunk_elements = elements[lo:hi]
 
-        # Find elements within this chunk
-        chunk_elements = [
-            elem for elem in elements
-            if start_line <= elem.line_number - 1 <= end_line
-        ]
+        # Count non-blank lines without rescanning the chunk
+        prefix = index.non_blank_prefix
+        stop = min(end_line + 1, len(text_lines))
+        non_blank_lines = prefix[stop] - prefix[min(start_line, stop)]
 
         return ChunkContext(
             start_line=start_line,
             end_line=end_line,
-            lines=chunk_lines,
+            text_lines=text_lines,
             errors=error_group,
-            elements=chunk_elements
+            elements=chunk_elements,
+            non_blank_lines=non_blank_lines
         )
 
     def _find_natural_boundaries(self,
                                 min_error_line: int,
                                 max_error_line: int,
-                                elements: List[ScreenplayElement],
+                                boundary_lines: List[int],
                                 text_lines: List[str]) -> Tuple[int, int]:
         """Find natural boundaries around the error region."""
         # Convert to 0-based indexing for text_lines
@@ -136,8 +166,8 @@ class ValidationChunker:
         end_line = min(len(text_lines) - 1, max_line_idx + self.CONTEXT_LINES_AFTER)
 
         # Extend to natural screenplay boundaries
-        start_line = self._find_boundary_start(start_line, elements)
-        end_line = self._find_boundary_end(end_line, elements, text_lines)
+        start_line = self._find_boundary_start(start_line, boundary_lines)
+        end_line = self._find_boundary_end(end_line, boundary_lines)
 
         # Ensure we don't exceed max chunk size
         if end_line - start_line + 1 > self.MAX_CHUNK_SIZE:
@@ -149,80 +179,67 @@ class ValidationChunker:
 
         return start_line, end_line
 
-    def _find_boundary_start(self, start_line: int, elements: List[ScreenplayElement]) -> int:
-        """Find a natural start boundary (e.g., beginning of a scene or dialogue block)."""
-        # Look backwards for natural boundaries
-        for elem in reversed(elements):
-            elem_line_idx = elem.line_number - 1  # Convert to 0-based
-
-            if elem_line_idx >= start_line:
-                continue  # Skip elements after our start
-
-            if elem_line_idx < start_line - 5:
-                break  # Don't look too far back
+    def _build_boundary_index(self, elements: List[ScreenplayElement]) -> List[int]:
+        """Build a sorted list of 0-based line indices where natural boundaries start."""
+        return sorted(
+            elem.line_number - 1 for elem in elements if elem.type in _BOUNDARY_TYPES
+        )
 
-            # Natural start points
-            if elem.type in [ElementType.SCENE_HEADING, ElementType.TRANSITION]:
-                return elem_line_idx
-            elif elem.type == ElementType.CHARACTER:
-                # Start of dialogue block
-                return elem_line_idx
+    def _find_boundary_start(self, start_line: int, boundary_lines: List[int]) -> int:
+        """Find a natural start boundary (e.g., beginning of a scene or dialogue block)."""
+        # Nearest boundary before our start, without looking too far back
+        i = bisect.bisect_left(boundary_lines, start_line) - 1
+        if i >= 0 and boundary_lines[i] >= start_line - 5:
+            return boundary_lines[i]
 
         return start_line
 
-    def _find_boundary_end(self, end_line: int, elements: List[ScreenplayElement], text_lines: List[str]) -> int:
+    def _find_boundary_end(self, end_line: int, boundary_lines: List[int]) -> int:
         """Find a natural end boundary."""
-        # Look forwards for natural boundaries
-        for elem in elements:
-            elem_line_idx = elem.line_number - 1  # Convert to 0-based
-
-            if elem_line_idx <= end_line:
-                continue  # Skip elements before our end
-
-            if elem_line_idx > end_line + 5:
-                break  # Don't look too far ahead
-
-            # Natural end points
-            if elem.type in [ElementType.SCENE_HEADING, ElementType.TRANSITION]:
-                return elem_line_idx - 1  # End before the next scene/transition
-            elif elem.type == ElementType.CHARACTER:
-                # If we hit a new character, end the current chunk
-                return elem_line_idx - 1
+        # Nearest boundary after our end, without looking too far ahead
+        i = bisect.bisect_right(boundary_lines, end_line)
+        if i < len(boundary_lines) and boundary_lines[i] <= end_line + 5:
+            return boundary_lines[i] - 1  # End before the next scene/transition/character
 
         return end_line
 
     def get_chunk_summary(self, chunk: ChunkContext) -> str:
         """Get a human-readable summary of the chunk."""
-        error_codes = [e.error_code.value for e in chunk.errors]
-        element_types = list(set(e.type.name for e in chunk.elements))
+        error_codes = list(map(attrgetter('error_code.value'), chunk.errors))
+        element_types = list(set(map(attrgetter('type.name'), chunk.elements)))
 
         return (f"Lines {chunk.start_line + 1}-{chunk.end_line + 1}: "
                 f"{len(chunk.errors)} errors ({', '.join(error_codes)}), "
                 f"elements: {', '.join(element_types)}")
 
     def validate_chunks(self, chunks: List[ChunkContext]) -> List[ChunkContext]:
-        """Validate and filter chunks before sending to LLM."""
-        valid_chunks = []
+        """
+        Validate and filter chunks before sending to LLM.
 
-        for chunk in chunks:
-            # Skip chunks that are too small or too large
-            if len(chunk.lines) < 1:
-                continue
-            if len(chunk.lines) > self.MAX_CHUNK_SIZE:
-                continue
+        create_chunks already applies these checks; this remains for chunks
+        built or modified elsewhere.
+        """
+        return [chunk for chunk in chunks if self._is_valid_chunk(chunk)]
 
-            # Skip chunks with no actual errors
-            if not chunk.errors:
-                continue
+    def _is_valid_chunk(self, chunk: ChunkContext) -> bool:
+        """Check whether a chunk is worth sending to the LLM."""
+        # Skip chunks that are too small or too large; the line count comes from
+        # the bounds so chunk.lines is only sliced for chunks that get prompted
+        line_count = min(chunk.end_line + 1, len(chunk.text_lines)) - chunk.start_line
+        if line_count < 1:
+            return False
+        if line_count > self.MAX_CHUNK_SIZE:
+            return False
 
-            # Skip chunks that are mostly blank lines
-            non_blank_lines = [line for line in chunk.lines if line.strip()]
-            if len(non_blank_lines) < 1:
-                continue
+        # Skip chunks with no actual errors
+        if not chunk.errors:
+            return False
 
-            valid_chunks.append(chunk)
+        # Skip chunks that are mostly blank lines
+        if chunk.non_blank_lines < 1:
+            return False
 
-        return valid_chunks
+        return True
 
     def chunk_stats(self, chunks: List[ChunkContext]) -> Dict[str, any]:
         """Get statistics about the chunks."""
@@ -236,19 +253,17 @@ class ValidationChunker:
             }
 
         total_lines = sum(len(chunk.lines) for chunk in chunks)
-        total_errors = sum(len(chunk.errors) for chunk in chunks)
 
         # Count error types
-        error_types = {}
-        for chunk in chunks:
-            for error in chunk.errors:
-                error_type = error.error_code.name
-                error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = Counter(
+            error.error_code.name for chunk in chunks for error in chunk.errors
+        )
+        total_errors = sum(error_types.values())
 
         return {
             'total_chunks': len(chunks),
             'total_lines': total_lines,
             'total_errors': total_errors,
             'avg_chunk_size': total_lines / len(chunks) if chunks else 0,
-            'error_types': error_types
+            'error_types': dict(error_types)
         }
\ No newline at end of file
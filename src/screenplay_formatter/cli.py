@@ -9,11 +9,28 @@ from typing import Optional
 import click
 
 from .parser import ScreenplayParser
-from .formatter import TextFormatter, DocxFormatter, PdfFormatter
-from .validator import ScreenplayValidator
 from .config import config_manager
 
 
+# Output format -> (formatter class in .formatter, label); the formatter
+# module is only imported once a format is actually chosen
+_FORMAT_REGISTRY = {
+    'text': ('TextFormatter', 'plain text'),
+    'txt': ('TextFormatter', 'plain text'),
+    'docx': ('DocxFormatter', 'DOCX'),
+    'pdf': ('PdfFormatter', 'PDF'),
+}
+
+# Screenplays are read in one go; a larger buffer means fewer read syscalls
+READ_BUFFER_SIZE = 1 << 16
+
+
+def _read_text(path: str) -> str:
+    """Read a whole text file using a 64 KiB buffer."""
+    with open(path, 'r', buffering=READ_BUFFER_SIZE) as f:
+        return f.read()
+
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="screenplay-formatter")
 def cli():
@@ -33,8 +50,7 @@ def format(input_file: str, output_file: str, format: Optional[str], validate: b
     """Format a screenplay from input file to output file."""
     try:
         # Read input file
-        with open(input_file, 'r') as f:
-            content = f.read()
+        content = _read_text(input_file)
 
         # Parse content
         parser = ScreenplayParser()
@@ -52,19 +68,16 @@ def format(input_file: str, output_file: str, format: Optional[str], validate: b
                 format = 'text'
 
         # Format based on type
-        if format in ['text', 'txt']:
-            formatter = TextFormatter(include_scene_numbers=scene_numbers)
-            click.echo("Formatting as plain text...")
-        elif format == 'docx':
-            formatter = DocxFormatter(include_scene_numbers=scene_numbers)
-            click.echo("Formatting as DOCX...")
-        elif format == 'pdf':
-            formatter = PdfFormatter(include_scene_numbers=scene_numbers)
-            click.echo("Formatting as PDF...")
-        else:
+        entry = _FORMAT_REGISTRY.get(format.lower())
+        if entry is None:
             click.echo(f"Unknown format: {format}", err=True)
             sys.exit(1)
 
+        class_name, label = entry
+        from . import formatter as formatter_module
+        formatter = getattr(formatter_module, class_name)(include_scene_numbers=scene_numbers)
+        click.echo(f"Formatting as {label}...")
+
         if scene_numbers:
             click.echo("Scene numbering enabled")
 
@@ -73,6 +86,7 @@ def format(input_file: str, output_file: str, format: Optional[str], validate: b
 
         # Optional validation
         if validate:
+            from .validator import ScreenplayValidator
             validator = ScreenplayValidator(strict_mode=strict)
             report = validator.validate(elements)
 
@@ -97,9 +111,10 @@ def format(input_file: str, output_file: str, format: Optional[str], validate: b
 def validate(input_file: str, output: Optional[str], format: str, strict: bool):
     """Validate a screenplay file."""
     try:
+        from .validator import ScreenplayValidator
+
         # Read and parse input
-        with open(input_file, 'r') as f:
-            content = f.read()
+        content = _read_text(input_file)
 
         parser = ScreenplayParser()
         elements = parser.parse(content)
@@ -139,34 +154,40 @@ def validate(input_file: str, output: Optional[str], format: str, strict: bool):
 def diff(input_file: str, reference_file: str, show_all: bool):
     """Compare two screenplay files for differences."""
     try:
+        from .element_diff import diff_opcodes
+
         # Read both files
-        with open(input_file, 'r') as f:
-            input_content = f.read()
-        with open(reference_file, 'r') as f:
-            reference_content = f.read()
+        input_content = _read_text(input_file)
+        reference_content = _read_text(reference_file)
 
         # Parse both
         parser = ScreenplayParser()
         input_elements = parser.parse(input_content)
         reference_elements = parser.parse(reference_content)
 
-        # Compare
+        # Compare with a minimal edit script so one inserted element doesn't
+        # misalign everything after it
         differences = []
-        max_len = max(len(input_elements), len(reference_elements))
-
-        for i in range(max_len):
-            input_elem = input_elements[i] if i < len(input_elements) else None
-            ref_elem = reference_elements[i] if i < len(reference_elements) else None
+        # Key on the enum's int value: Enum.__hash__ runs in Python, int hashing doesn't
+        opcodes = diff_opcodes(
+            [(e.type.value, e.content) for e in input_elements],
+            [(e.type.value, e.content) for e in reference_elements]
+        )
 
-            if not input_elem and ref_elem:
-                differences.append(f"Line {i+1}: Missing in input")
-            elif input_elem and not ref_elem:
-                differences.append(f"Line {i+1}: Extra in input")
-            elif input_elem and ref_elem:
+        for tag, i1, i2, j1, j2 in opcodes:
+            # Pair up replaced elements, then report what is left over
+            paired = min(i2 - i1, j2 - j1)
+            for input_elem, ref_elem in zip(input_elements[i1:i1 + paired],
+                                            reference_elements[j1:j1 + paired]):
                 if input_elem.type != ref_elem.type:
-                    differences.append(f"Line {i+1}: Type mismatch ({input_elem.type.name} vs {ref_elem.type.name})")
-                elif input_elem.content != ref_elem.content:
-                    differences.append(f"Line {i+1}: Content mismatch")
+                    differences.append(f"Line {input_elem.line_number}: Type mismatch "
+                                       f"({input_elem.type.name} vs {ref_elem.type.name})")
+                else:
+                    differences.append(f"Line {input_elem.line_number}: Content mismatch")
+            for input_elem in input_elements[i1 + paired:i2]:
+                differences.append(f"Line {input_elem.line_number}: Extra in input")
+            for ref_elem in reference_elements[j1 + paired:j2]:
+                differences.append(f"Line {ref_elem.line_number}: Missing in input")
 
         # Output differences
         if not differences:
@@ -189,18 +210,21 @@ def diff(input_file: str, reference_file: str, show_all: bool):
 @click.option('--output', '-o', type=click.Path(), help='Output file for fixed screenplay')
 @click.option('--dry-run', is_flag=True, help='Preview fixes without applying them')
 @click.option('--model', default='gpt-4o-mini', help='OpenAI model to use')
+@click.option('--strong-model', help='Larger model for structural errors and low-confidence fixes')
 @click.option('--confidence', type=float, default=0.8, help='Minimum confidence for auto-apply')
 @click.option('--audit', type=click.Path(), help='Export audit log to JSON file')
 @click.option('--strict', is_flag=True, help='Use strict validation mode')
-def fix(input_file: str, output: Optional[str], dry_run: bool, model: str, confidence: float, audit: Optional[str], strict: bool):
+@click.option('--cache', is_flag=True, help='Reuse results cached from previous runs on identical input')
+@click.option('--batch', is_flag=True, help='Use the OpenAI Batch API (cheaper, may take hours)')
+def fix(input_file: str, output: Optional[str], dry_run: bool, model: str, strong_model: Optional[str],
+        confidence: float, audit: Optional[str], strict: bool, cache: bool, batch: bool):
     """Fix screenplay formatting using LLM assistance."""
     try:
         from .llm_corrector import LLMCorrector
         from .fix_engine import FixEngine
 
         # Read input file
-        with open(input_file, 'r') as f:
-            content = f.read()
+        content = _read_text(input_file)
 
         # Initialize LLM corrector
         try:
@@ -208,7 +232,8 @@ def fix(input_file: str, output: Optional[str], dry_run: bool, model: str, confi
             corrector = LLMCorrector(
                 api_key=api_key,
                 model=model,
-                min_confidence=confidence
+                min_confidence=confidence,
+                strong_model=strong_model
             )
         except ValueError as e:
             click.echo(f"Error: {e}", err=True)
@@ -219,7 +244,9 @@ def fix(input_file: str, output: Optional[str], dry_run: bool, model: str, confi
         engine = FixEngine(
             llm_corrector=corrector,
             strict_validation=strict,
-            dry_run=dry_run
+            dry_run=dry_run,
+            use_cache=cache,
+            batch=batch
         )
 
         # Run fix process
@@ -293,20 +320,22 @@ def config(set_api_key, remove_api_key, model, confidence, strict, show, reset):
         config_manager.set_openai_api_key(set_api_key)
         return
 
-    if model:
-        config_manager.set_default_model(model)
-        click.echo(f"Default model set to: {model}")
-
-    if confidence is not None:
-        try:
-            config_manager.set_default_confidence(confidence)
-            click.echo(f"Default confidence set to: {confidence}")
-        except ValueError as e:
-            click.echo(f"Error: {e}", err=True)
-
-    if strict is not None:
-        config_manager.set_strict_validation(strict)
-        click.echo(f"Strict validation set to: {strict}")
+    # Save once after all settings are applied
+    with config_manager.batch():
+        if model:
+            config_manager.set_default_model(model)
+            click.echo(f"Default model set to: {model}")
+
+        if confidence is not None:
+            try:
+                config_manager.set_default_confidence(confidence)
+                click.echo(f"Default confidence set to: {confidence}")
+            except ValueError as e:
+                click.echo(f"Error: {e}", err=True)
+
+        if strict is not None:
+            config_manager.set_strict_validation(strict)
+            click.echo(f"Strict validation set to: {strict}")
 
     if show or not any([set_api_key, remove_api_key, model, confidence is not None, strict is not None]):
         # Show config if no other action taken or explicitly requested
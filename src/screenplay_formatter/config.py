@@ -2,6 +2,7 @@
 
 import os
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -17,13 +18,16 @@ class ConfigManager:
         # Load existing config
         self._config = self._load_config()
 
+        # Unsaved changes, and how many batch() blocks are open
+        self._dirty = False
+        self._batch_depth = 0
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                return json.loads(self.config_file.read_bytes())
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError):
                 pass
 
         # Return default config
@@ -36,16 +40,35 @@ class ConfigManager:
 
     def _save_config(self):
         """Save configuration to file."""
+        self._dirty = False
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            self.config_file.write_bytes(json.dumps(self._config, indent=2).encode('utf-8'))
         except IOError as e:
             print(f"Warning: Could not save config: {e}")
 
+    def _set(self, key: str, value: Any):
+        """Update a setting, saving immediately unless inside batch()."""
+        if self._config.get(key) == value:
+            return
+        self._config[key] = value
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_config()
+
+    @contextmanager
+    def batch(self):
+        """Apply several settings with at most one write at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save_config()
+
     def set_openai_api_key(self, api_key: str):
         """Set OpenAI API key."""
-        self._config['openai_api_key'] = api_key
-        self._save_config()
+        self._set('openai_api_key', api_key)
         print("OpenAI API key saved successfully!")
 
     def get_openai_api_key(self) -> Optional[str]:
@@ -55,8 +78,7 @@ class ConfigManager:
 
     def remove_openai_api_key(self):
         """Remove stored OpenAI API key."""
-        self._config['openai_api_key'] = None
-        self._save_config()
+        self._set('openai_api_key', None)
         print("OpenAI API key removed from config")
 
     def has_api_key(self) -> bool:
@@ -65,8 +87,7 @@ class ConfigManager:
 
     def set_default_model(self, model: str):
         """Set default OpenAI model."""
-        self._config['default_model'] = model
-        self._save_config()
+        self._set('default_model', model)
 
     def get_default_model(self) -> str:
         """Get default OpenAI model."""
@@ -75,8 +96,7 @@ class ConfigManager:
     def set_default_confidence(self, confidence: float):
         """Set default confidence threshold."""
         if 0.0 <= confidence <= 1.0:
-            self._config['default_confidence'] = confidence
-            self._save_config()
+            self._set('default_confidence', confidence)
         else:
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
@@ -86,8 +106,7 @@ class ConfigManager:
 
     def set_strict_validation(self, strict: bool):
         """Set strict validation mode."""
-        self._config['strict_validation'] = strict
-        self._save_config()
+        self._set('strict_validation', strict)
 
     def get_strict_validation(self) -> bool:
         """Get strict validation setting."""
@@ -95,24 +114,20 @@ class ConfigManager:
 
     def show_config(self) -> str:
         """Show current configuration."""
-        lines = []
-        lines.append("Current Configuration:")
-        lines.append("-" * 30)
-
         api_key = self.get_openai_api_key()
         if api_key:
             masked_key = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
-            lines.append(f"OpenAI API Key: {masked_key}")
         else:
-            lines.append("OpenAI API Key: Not set")
-
-        lines.append(f"Default Model: {self.get_default_model()}")
-        lines.append(f"Default Confidence: {self.get_default_confidence()}")
-        lines.append(f"Strict Validation: {self.get_strict_validation()}")
-        lines.append("")
-        lines.append(f"Config file: {self.config_file}")
-
-        return '\n'.join(lines)
+            masked_key = "Not set"
+
+        return (f"Current Configuration:\n"
+                f"{'-' * 30}\n"
+                f"OpenAI API Key: {masked_key}\n"
+                f"Default Model: {self.get_default_model()}\n"
+                f"Default Confidence: {self.get_default_confidence()}\n"
+                f"Strict Validation: {self.get_strict_validation()}\n"
+                f"\n"
+                f"Config file: {self.config_file}")
 
     def reset_config(self):
         """Reset configuration to defaults."""
@@ -0,0 +1,178 @@
+"""Element-level diff for comparing parsed screenplays."""
+
+from typing import Hashable, List, Optional, Sequence, Tuple
+
+
+# Opcode tags (same meaning as difflib.SequenceMatcher.get_opcodes)
+REPLACE = 'replace'
+DELETE = 'delete'
+INSERT = 'insert'
+
+# (tag, i1, i2, j1, j2): a[i1:i2] should be replaced by b[j1:j2]
+Opcode = Tuple[str, int, int, int, int]
+
+
+def diff_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Opcode]:
+    """
+    Compute a minimal edit script between two sequences using Myers' O(ND) diff.
+
+    Only the differing regions are returned; everything between them is equal.
+
+    Args:
+        a: First sequence (e.g., (type, content) tuples of the input screenplay)
+        b: Second sequence (e.g., (type, content) tuples of the reference)
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) opcodes with tag in REPLACE, DELETE, INSERT
+    """
+    # Trim the common prefix and suffix first; near-identical files never
+    # get as far as hashing the elements they share
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    if prefix == len(a) == len(b):
+        return []
+
+    # Map the remaining items to small ints so the inner loops compare ints, not tuples
+    ids = {}
+    a_ids = [ids.setdefault(item, len(ids)) for item in a[prefix:len(a) - suffix]]
+    b_ids = [ids.setdefault(item, len(ids)) for item in b[prefix:len(b) - suffix]]
+
+    edits: List[Tuple[str, int, int]] = []
+    _diff(a_ids, b_ids, prefix, prefix, edits)
+
+    # Merge adjacent single-element edits into opcodes
+    opcodes = []
+    for tag, i, j in edits:
+        if opcodes and opcodes[-1][2] == i and opcodes[-1][4] == j:
+            last = opcodes[-1]
+        else:
+            last = [tag, i, i, j, j]
+            opcodes.append(last)
+        if tag == DELETE:
+            last[2] += 1
+        else:
+            last[4] += 1
+
+    for opcode in opcodes:
+        _, i1, i2, j1, j2 = opcode
+        opcode[0] = REPLACE if i1 < i2 and j1 < j2 else (DELETE if i1 < i2 else INSERT)
+
+    return [tuple(opcode) for opcode in opcodes]
+
+
+def _diff(a: List[int], b: List[int], a_offset: int, b_offset: int,
+          edits: List[Tuple[str, int, int]]):
+    """Append (tag, i, j) edits turning a into b, in order."""
+    # Trim common prefix and suffix
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    a = a[prefix:len(a) - suffix]
+    b = b[prefix:len(b) - suffix]
+    a_offset += prefix
+    b_offset += prefix
+
+    if not a:
+        edits.extend((INSERT, a_offset, b_offset + k) for k in range(len(b)))
+        return
+    if not b:
+        edits.extend((DELETE, a_offset + k, b_offset) for k in range(len(a)))
+        return
+
+    split = _middle_snake(a, b)
+    if split is None:
+        # Nothing in common: delete everything, then insert everything
+        edits.extend((DELETE, a_offset + k, b_offset) for k in range(len(a)))
+        edits.extend((INSERT, a_offset + len(a), b_offset + k) for k in range(len(b)))
+        return
+
+    # Divide and conquer around the middle snake
+    x, y = split
+    _diff(a[:x], b[:y], a_offset, b_offset, edits)
+    _diff(a[x:], b[y:], a_offset + x, b_offset + y, edits)
+
+
+def _middle_snake(a: List[int], b: List[int]) -> Optional[Tuple[int, int]]:
+    """
+    Find the point where the forward and reverse D-paths of Myers' algorithm meet.
+
+    Uses two V arrays of size O(N + M), so memory stays linear.
+
+    Returns:
+        (x, y) split point, or None if the sequences have nothing in common
+    """
+    n, m = len(a), len(b)
+    max_d = (n + m + 1) // 2
+    v_offset = max_d
+    v_length = 2 * max_d + 2
+    v1 = [-1] * v_length
+    v2 = [-1] * v_length
+    v1[v_offset + 1] = 0
+    v2[v_offset + 1] = 0
+    delta = n - m
+    # If the length difference is odd, the forward path is the one that meets the reverse path
+    front = delta % 2 != 0
+    # Offsets for start and end of k loop; prevent mapping of space beyond the grid
+    k1_start = k1_end = k2_start = k2_end = 0
+
+    for d in range(max_d):
+        # Walk the front path one step
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[x1] == b[y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1_end += 2  # Ran off the right of the graph
+            elif y1 > m:
+                k1_start += 2  # Ran off the bottom of the graph
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    # Mirror x2 onto top-left coordinate system
+                    if x1 >= n - v2[k2_offset]:
+                        return x1, y1
+
+        # Walk the reverse path one step
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[n - x2 - 1] == b[m - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2_end += 2  # Ran off the left of the graph
+            elif y2 > m:
+                k2_start += 2  # Ran off the top of the graph
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = v_offset + x1 - k1_offset
+                    # Mirror x2 onto top-left coordinate system
+                    if x1 >= n - x2:
+                        return x1, y1
+
+    return None
@@ -1,19 +1,36 @@
 """Fix engine that orchestrates LLM correction with apply/reject logic."""
 
+import io
+import os
 import json
+import hashlib
 import logging
 import difflib
 from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
+from pydantic import TypeAdapter
 
+from . import __version__
 from .parser import ScreenplayParser, ScreenplayElement
 from .validator import ScreenplayValidator, ValidationReport
 from .llm_corrector import LLMCorrector, CorrectionResponse, ChunkContext
 from .chunker import ValidationChunker
 
 
+# Bump when parsing, validation or fix application changes what a run produces,
+# so results cached by an older version are not reused
+FIX_CACHE_VERSION = 2
+
+# Cached results kept on disk; the oldest are removed beyond this
+FIX_CACHE_MAX_ENTRIES = 100
+
+# Serializes audit data (including pydantic models) with pydantic-core's native encoder
+_AUDIT_LOG_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
 @dataclass
 class FixResult:
     """Result of a fix operation."""
@@ -37,9 +54,18 @@ class AppliedFix:
     revised_lines: List[str]
     confidence: float
     issues: List[str]
-    diff: str
     timestamp: str
 
+    @cached_property
+    def diff(self) -> str:
+        """Unified diff of the fix, computed on first access."""
+        return '\n'.join(difflib.unified_diff(
+            self.original_lines,
+            self.revised_lines,
+            lineterm='',
+            n=1
+        ))
+
 
 class FixEngine:
     """Orchestrates the LLM-powered screenplay correction process."""
@@ -47,7 +73,13 @@ class FixEngine:
     def __init__(self,
                  llm_corrector: LLMCorrector,
                  strict_validation: bool = False,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 cache_dir: Optional[Path] = None,
+                 use_cache: bool = False,
+                 batch: bool = False,
+                 parser: Optional[ScreenplayParser] = None,
+                 validator: Optional[ScreenplayValidator] = None,
+                 chunker: Optional[ValidationChunker] = None):
         """
         Initialize fix engine.
 
@@ -55,14 +87,26 @@ class FixEngine:
             llm_corrector: LLM corrector instance
             strict_validation: Use strict validation mode
             dry_run: Preview fixes without applying them
+            cache_dir: Directory for cached fix results (defaults to ~/.screenplay_formatter/fix_cache)
+            use_cache: Reuse the result of a previous run on identical input. Cached
+                results hold the screenplay text in plain JSON under cache_dir.
+            batch: Send chunks through the OpenAI Batch API (cheaper, but not interactive)
+            parser: Parser to reuse (a new one is created if omitted)
+            validator: Validator to reuse; must match strict_validation (a new one is created if omitted)
+            chunker: Chunker to reuse (a new one is created if omitted)
         """
         self.corrector = llm_corrector
         self.strict_validation = strict_validation
         self.dry_run = dry_run
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.screenplay_formatter' / 'fix_cache'
+        self.use_cache = use_cache
+        self.batch = batch
 
-        self.parser = ScreenplayParser()
-        self.validator = ScreenplayValidator(strict_mode=strict_validation)
-        self.chunker = ValidationChunker()
+        # Parsers and validators keep per-run state, so they are shared
+        # explicitly by the caller rather than through a global pool
+        self.parser = parser or ScreenplayParser()
+        self.validator = validator or ScreenplayValidator(strict_mode=strict_validation)
+        self.chunker = chunker or ValidationChunker()
 
         # Setup logging
         self.logger = logging.getLogger(__name__)
@@ -85,6 +129,13 @@ class FixEngine:
         """
         self.logger.info("Starting screenplay fix process")
 
+        cache_key = self._fix_cache_key(input_text)
+        if self.use_cache:
+            cached = self._load_cached_result(cache_key)
+            if cached is not None:
+                self.logger.info("Reusing cached result for identical input")
+                return cached
+
         # Parse and validate
         elements = self.parser.parse(input_text)
         initial_report = self.validator.validate(elements)
@@ -107,13 +158,13 @@ class FixEngine:
 
         # Create chunks for LLM processing
         text_lines = input_text.split('\n')
-        error_list = [self._validation_error_from_dict(err) for err in initial_report.errors]
-        chunks = self.chunker.create_chunks(elements, error_list, text_lines)
-        chunks = self.chunker.validate_chunks(chunks)
+        # The validator keeps the ValidationError objects behind the report's dicts
+        chunks = self.chunker.create_chunks(elements, self.validator.errors, text_lines)
 
         self.logger.info(f"Created {len(chunks)} chunks for processing")
 
-        # Process chunks with LLM
+        # Process chunks with LLM; fixes from one run share a timestamp
+        run_timestamp = datetime.now().isoformat()
         corrections = []
         applied_fixes = []
         suggested_fixes = []
@@ -121,23 +172,22 @@ class FixEngine:
         for i, chunk in enumerate(chunks):
             self.logger.info(f"Processing chunk {i+1}/{len(chunks)}: {self.chunker.get_chunk_summary(chunk)}")
 
+        # Chunks are independent, so their API calls can overlap
+        if self.batch:
+            results = self.corrector.correct_chunks_batch(chunks)
+        else:
+            results = self.corrector.correct_chunks(chunks)
+
+        min_confidence = self.corrector.min_confidence
+        for i, (chunk, (correction, applied)) in enumerate(zip(chunks, results)):
             try:
-                correction, applied = self.corrector.correct_chunk(chunk)
                 corrections.append(correction)
 
-                if applied and not self.dry_run:
-                    # Apply high-confidence fixes
+                # Apply high-confidence fixes (in dry run, count what would be applied)
+                if applied or self.dry_run:
                     for fix in correction.fixes:
-                        if fix.confidence >= self.corrector.min_confidence:
-                            applied_fix = self._create_applied_fix(chunk, fix)
-                            applied_fixes.append(applied_fix)
-                        else:
-                            suggested_fixes.append(fix)
-                elif self.dry_run:
-                    # In dry run, count what would be applied
-                    for fix in correction.fixes:
-                        if fix.confidence >= self.corrector.min_confidence:
-                            applied_fixes.append(self._create_applied_fix(chunk, fix))
+                        if fix.confidence >= min_confidence:
+                            applied_fixes.append(self._create_applied_fix(chunk, fix, run_timestamp))
                         else:
                             suggested_fixes.append(fix)
 
@@ -149,9 +199,12 @@ class FixEngine:
         if applied_fixes and not self.dry_run:
             corrected_text = self._apply_fixes_to_text(input_text, applied_fixes)
 
-            # Re-validate
-            corrected_elements = self.parser.parse(corrected_text)
-            final_report = self.validator.validate(corrected_elements)
+            # Re-validate, unless the fixes didn't change anything
+            if corrected_text == input_text:
+                final_report = initial_report
+            else:
+                corrected_elements = self.parser.parse(corrected_text)
+                final_report = self.validator.validate(corrected_elements)
         else:
             final_report = initial_report
             corrected_text = input_text
@@ -178,34 +231,82 @@ class FixEngine:
                         f"{len(suggested_fixes)} suggested, "
                         f"{final_report.total_errors} errors remaining")
 
+        if self.use_cache and result.success:
+            self._save_cached_result(cache_key, result)
+
         return result
 
-    def _validation_error_from_dict(self, error_dict: Dict) -> Any:
-        """Convert validation error dict back to ValidationError object."""
-        # This is a simplified conversion - in practice you'd need proper deserialization
-        from .validator import ValidationError, ErrorCode, ElementType
+    def _fix_cache_key(self, input_text: str) -> str:
+        """Hash the input together with every setting that affects the result."""
+        corrector = self.corrector
+        settings = (f"{__version__}|{FIX_CACHE_VERSION}|"
+                    f"{getattr(corrector, 'model', 'unknown')}|"
+                    f"{getattr(corrector, 'strong_model', None)}|"
+                    f"{getattr(corrector, 'min_confidence', '')}|"
+                    f"{getattr(corrector, 'max_edit_distance', '')}|"
+                    f"{getattr(corrector, 'temperature', '')}|"
+                    f"{getattr(corrector, 'top_p', '')}|"
+                    f"{self.strict_validation}|{self.dry_run}")
+        return hashlib.blake2b(input_text.encode('utf-8') + b'\0' + settings.encode('utf-8'),
+                               digest_size=16).hexdigest()
+
+    def _load_cached_result(self, key: str) -> Optional[FixResult]:
+        """Load a cached FixResult, or None if there isn't a usable one."""
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, 'r') as f:
+                data = json.load(f)
+            data['corrections'] = [CorrectionResponse.model_validate(c) for c in data['corrections']]
+            if data['final_validation'] is not None:
+                data['final_validation'] = ValidationReport.model_validate(data['final_validation'])
+            return FixResult(**data)
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable fix cache entry {cache_file.name}: {e}")
+            return None
+
+    def _save_cached_result(self, key: str, result: FixResult):
+        """Store a FixResult so identical runs can skip the LLM."""
+        data = asdict(result)
+        data['corrections'] = [correction.model_dump() for correction in result.corrections]
+        if result.final_validation is not None:
+            data['final_validation'] = result.final_validation.model_dump()
+
+        cache_file = self.cache_dir / f"{key}.json"
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            # The cache holds screenplay text, so keep it private to the user
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_file, cache_file)
+            self._evict_cached_results()
+        except (IOError, OSError) as e:
+            self.logger.warning(f"Could not write fix cache: {e}")
+
+    def _evict_cached_results(self):
+        """Remove the oldest cached results beyond FIX_CACHE_MAX_ENTRIES."""
+        entries = []
+        for cache_file in self.cache_dir.glob('*.json'):
+            try:
+                entries.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue  # Removed by another run
 
-        class MockError:
-            def __init__(self, data):
-                self.line_number = data['line_number']
-                self.error_code = ErrorCode(data['error_code'])
-                self.message = data['message']
-                self.element_type = ElementType[data['element_type']]
-                self.content = data['content']
-                self.suggestion = data.get('suggestion')
-                self.confidence = data.get('confidence', 0.0)
+        if len(entries) <= FIX_CACHE_MAX_ENTRIES:
+            return
 
-        return MockError(error_dict)
+        entries.sort()
+        for _, cache_file in entries[:len(entries) - FIX_CACHE_MAX_ENTRIES]:
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
 
-    def _create_applied_fix(self, chunk: ChunkContext, fix) -> AppliedFix:
+    def _create_applied_fix(self, chunk: ChunkContext, fix, timestamp: str) -> AppliedFix:
         """Create an AppliedFix record."""
-        diff = '\n'.join(difflib.unified_diff(
-            fix.original,
-            fix.revised,
-            lineterm='',
-            n=1
-        ))
-
         return AppliedFix(
             chunk_start=chunk.start_line + fix.start_line,
             chunk_end=chunk.start_line + fix.end_line,
@@ -213,22 +314,26 @@ class FixEngine:
             revised_lines=fix.revised,
             confidence=fix.confidence,
             issues=fix.issues,
-            diff=diff,
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
 
     def _apply_fixes_to_text(self, original_text: str, applied_fixes: List[AppliedFix]) -> str:
         """Apply fixes to the original text."""
         lines = original_text.split('\n')
 
-        # Sort fixes by start line (descending) to apply from bottom up
-        fixes_sorted = sorted(applied_fixes, key=lambda f: f.chunk_start, reverse=True)
-
-        for fix in fixes_sorted:
-            # Replace lines in the range
-            lines[fix.chunk_start:fix.chunk_end + 1] = fix.revised_lines
+        # Rebuild the text in one forward pass instead of splicing each fix in
+        corrected = []
+        cursor = 0
+        for fix in sorted(applied_fixes, key=lambda f: f.chunk_start):
+            if fix.chunk_start < cursor:
+                self.logger.warning(f"Skipping fix at line {fix.chunk_start}: overlaps a previous fix")
+                continue
+            corrected.extend(lines[cursor:fix.chunk_start])
+            corrected.extend(fix.revised_lines)
+            cursor = fix.chunk_end + 1
 
-        return '\n'.join(lines)
+        corrected.extend(lines[cursor:])
+        return '\n'.join(corrected)
 
     def _create_audit_log(self, operation: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create audit log entry."""
@@ -253,46 +358,44 @@ class FixEngine:
             'chunks_processed': result.chunks_processed
         }
 
+        # Corrections are passed as models and serialized directly, without
+        # an intermediate model_dump() copy of each one
         audit_data = {
             'summary': summary_dict,
             'detailed_log': result.audit_log,
-            'corrections': [correction.model_dump() for correction in result.corrections]
+            'corrections': result.corrections
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(audit_data, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            f.write(_AUDIT_LOG_ADAPTER.dump_json(audit_data, indent=2))
 
         self.logger.info(f"Audit log exported to {output_path}")
 
     def get_fix_summary(self, result: FixResult) -> str:
         """Get human-readable summary of fix results."""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("SCREENPLAY FIX SUMMARY")
-        lines.append("=" * 60)
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 60 + "\nSCREENPLAY FIX SUMMARY\n" + "=" * 60 + "\n")
 
-        if result.dry_run:
-            lines.append("MODE: Dry Run (preview only)")
-            lines.append("")
+        if self.dry_run:
+            write("MODE: Dry Run (preview only)\n\n")
 
-        lines.append(f"Original errors: {result.original_errors}")
-        lines.append(f"Remaining errors: {result.remaining_errors}")
-        lines.append(f"Applied fixes: {result.applied_fixes}")
-        lines.append(f"Suggested fixes: {result.suggested_fixes}")
-        lines.append(f"Chunks processed: {result.chunks_processed}")
+        write(f"Original errors: {result.original_errors}\n"
+              f"Remaining errors: {result.remaining_errors}\n"
+              f"Applied fixes: {result.applied_fixes}\n"
+              f"Suggested fixes: {result.suggested_fixes}\n"
+              f"Chunks processed: {result.chunks_processed}\n")
 
         improvement = result.original_errors - result.remaining_errors
         if result.original_errors > 0:
             pct = (improvement / result.original_errors) * 100
-            lines.append(f"Improvement: {improvement} errors fixed ({pct:.1f}%)")
+            write(f"Improvement: {improvement} errors fixed ({pct:.1f}%)\n")
 
-        lines.append("")
-        lines.append("Status: " + ("SUCCESS" if result.success else "FAILED"))
+        write("\nStatus: " + ("SUCCESS" if result.success else "FAILED"))
 
         if result.final_validation and not result.final_validation.passed:
-            lines.append("")
-            lines.append("Remaining Issues:")
+            write("\n\nRemaining Issues:")
             for error_type, count in result.final_validation.errors_by_type.items():
-                lines.append(f"  {error_type}: {count}")
+                write(f"\n  {error_type}: {count}")
 
-        return '\n'.join(lines)
\ No newline at end of file
+        return buf.getvalue()
@@ -1,14 +1,21 @@
 """Formatter modules for different output formats."""
 
+import io
 import os
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -18,6 +25,100 @@ from reportlab.pdfbase.ttfonts import TTFont
 from .parser import ScreenplayElement, ElementType
 
 
+# Output files are written in one call; a large buffer avoids splitting it up
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Plain-text page break (ASCII form feed)
+PAGE_BREAK_CHAR = '\x0c'
+
+
+@lru_cache(maxsize=64)
+def _wrap_pattern(width: int) -> re.Pattern:
+    """Regex matching one greedily-wrapped line of at most `width` characters."""
+    # Longest run that ends at a word boundary, or a single overlong word
+    return re.compile(r'(.{1,%d})(?: |$)|(\S+)(?: |$)' % width)
+
+
+def _wrap_words(text: str, width: int) -> List[str]:
+    """
+    Greedily wrap text into lines of at most `width` characters.
+
+    Line breaks are found by the regex engine over the space-normalized text
+    instead of measuring words one at a time in Python. As in the original
+    per-word loop, the first line only gets `width - 1` characters.
+    """
+    words = text.split()
+    if width < 2 or not words:
+        return words
+
+    joined = ' '.join(words)
+    first = _wrap_pattern(width - 1).match(joined)
+    lines = [first.group(1) or first.group(2)]
+    lines.extend(short or long for short, long in _wrap_pattern(width).findall(joined, first.end()))
+    return lines
+
+
+def _wrap_words_optimal(text: str, width: int) -> List[str]:
+    """
+    Wrap text into lines of at most `width` characters with minimum raggedness.
+
+    Knuth-Plass style optimal fit: picks the breaks minimizing the sum of squared
+    slack over all lines, the last one included, so a paragraph does not end on
+    a stray short line. Words are few per line at screenplay widths, so the DP
+    only tries a handful of break points for each word.
+    """
+    words = text.split()
+    if width < 2 or not words:
+        return words
+
+    n = len(words)
+    best = [0] + [float('inf')] * n  # best[j]: cost of setting words[:j]
+    parent = [0] * (n + 1)  # parent[j]: start of the last line in that setting
+    for j in range(1, n + 1):
+        line_length = -1
+        for i in range(j - 1, -1, -1):
+            line_length += len(words[i]) + 1
+            if line_length > width and i < j - 1:
+                break
+            # An overlong single word gets a line to itself at no extra cost
+            slack = max(width - line_length, 0)
+            cost = best[i] + slack * slack
+            if cost < best[j]:
+                best[j] = cost
+                parent[j] = i
+
+    lines = []
+    j = n
+    while j > 0:
+        lines.append(' '.join(words[parent[j]:j]))
+        j = parent[j]
+    lines.reverse()
+    return lines
+
+
+def _next_non_blank_types(elements: List[ScreenplayElement]) -> List[Optional[ElementType]]:
+    """For each index, the type of the next non-blank element after it (None at the end)."""
+    next_types: List[Optional[ElementType]] = [None] * len(elements)
+    next_type = None
+    for i in range(len(elements) - 1, -1, -1):
+        next_types[i] = next_type
+        if elements[i].type != ElementType.BLANK:
+            next_type = elements[i].type
+    return next_types
+
+
+@lru_cache(maxsize=1024)
+def _wrap_words_cached(text: str, width: int, optimal: bool = False) -> Tuple[str, ...]:
+    """Memoized _wrap_words (or _wrap_words_optimal), for text that is wrapped more than once."""
+    return tuple((_wrap_words_optimal if optimal else _wrap_words)(text, width))
+
+
+# Shared python-docx lengths for the DOCX style table
+_PT0 = Pt(0)
+_PT12 = Pt(12)
+_INCHES = {value: Inches(value) for value in (1.0, 1.5, 1.6, 2.0)}
+
+
 class BaseFormatter(ABC):
     """Base class for screenplay formatters."""
 
@@ -40,16 +141,44 @@ class BaseFormatter(ABC):
     FONT_NAME = "Courier"
     FONT_SIZE = 12
 
+    TITLE_PAGE_TYPES = frozenset({
+        ElementType.TITLE_PAGE_TITLE, ElementType.TITLE_PAGE_AUTHOR,
+        ElementType.TITLE_PAGE_CONTACT, ElementType.TITLE_PAGE_CREDIT,
+    })
+
     @abstractmethod
     def format(self, elements: List[ScreenplayElement], output_path: str):
         """Format screenplay elements and save to file."""
         pass
 
+    def _split_title_page(self, elements: List[ScreenplayElement]
+                          ) -> Tuple[List[ScreenplayElement], List[ScreenplayElement]]:
+        """Partition elements into (title page, screenplay body) in one pass."""
+        title_page_elements = []
+        screenplay_elements = []
+        for element in elements:
+            if element.type in self.TITLE_PAGE_TYPES:
+                title_page_elements.append(element)
+            else:
+                screenplay_elements.append(element)
+        return title_page_elements, screenplay_elements
+
 
 class TextFormatter(BaseFormatter):
     """Format screenplay as plain text with spacing."""
 
-    def __init__(self, include_scene_numbers: bool = False):
+    _ALWAYS_SPACED_TYPES = frozenset({
+        ElementType.SCENE_HEADING, ElementType.SHOT, ElementType.TRANSITION,
+    })
+    _DIALOGUE_TYPES = frozenset({ElementType.DIALOGUE, ElementType.PARENTHETICAL})
+    _WRAPPED_TYPES = frozenset({
+        ElementType.ACTION, ElementType.DIALOGUE, ElementType.PARENTHETICAL,
+    })
+    _CHARACTER_TYPES = frozenset({
+        ElementType.CHARACTER, ElementType.DUAL_DIALOGUE_LEFT, ElementType.DUAL_DIALOGUE_RIGHT,
+    })
+
+    def __init__(self, include_scene_numbers: bool = False, optimal_wrap: bool = False):
         # Calculate character positions for 80-character width
         self.page_width_chars = 80
         self.left_margin_chars = 15
@@ -59,35 +188,51 @@ class TextFormatter(BaseFormatter):
         self.parenthetical_indent = 31
         self.transition_position = 70
         self.include_scene_numbers = include_scene_numbers
+        self.optimal_wrap = optimal_wrap
 
     def format(self, elements: List[ScreenplayElement], output_path: str):
         """Format screenplay elements as plain text."""
-        lines = []
-
+        # Stream pieces straight to the (large) file buffer; newlines go between
+        # pieces, so the file does not end with one
+        with open(output_path, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+            pieces = self._iter_pieces(elements)
+            first = next(pieces, None)
+            if first is not None:
+                f.write(first)
+                f.writelines('\n' + piece for piece in pieces)
+
+    def _iter_pieces(self, elements: List[ScreenplayElement]) -> Iterator[str]:
+        """Yield the output text as pieces to be joined by newlines; a piece may span several lines."""
         # Separate title page elements from screenplay body
-        title_page_elements = [e for e in elements if e.type in [
-            ElementType.TITLE_PAGE_TITLE, ElementType.TITLE_PAGE_AUTHOR,
-            ElementType.TITLE_PAGE_CONTACT, ElementType.TITLE_PAGE_CREDIT
-        ]]
-        screenplay_elements = [e for e in elements if e not in title_page_elements]
+        title_page_elements, screenplay_elements = self._split_title_page(elements)
 
         # Format title page if present
         if title_page_elements:
-            lines.extend(self._format_title_page(title_page_elements))
-            lines.append("")  # Page break after title page
-
-        for i, element in enumerate(screenplay_elements):
-            formatted = self._format_element(element)
-            if formatted:
-                lines.extend(formatted)
+            yield '\n'.join(self._format_title_page(title_page_elements))
+            yield ''  # Page break after title page
+
+        # Character cues, transitions and slugs repeat throughout a screenplay;
+        # each distinct one is formatted once and its text reused. Wrapped prose
+        # rarely repeats, and caching it would keep the whole script in memory.
+        rendered = {}
+        next_types = _next_non_blank_types(screenplay_elements)
+        for element, next_type in zip(screenplay_elements, next_types):
+            if element.type in self._WRAPPED_TYPES:
+                formatted = self._format_element(element)
+                text = '\n'.join(formatted) if formatted else None
+            else:
+                key = (element.type, element.content, element.scene_number)
+                try:
+                    text = rendered[key]
+                except KeyError:
+                    formatted = self._format_element(element)
+                    text = rendered[key] = '\n'.join(formatted) if formatted else None
+            if text is not None:
+                yield text
 
             # Add spacing between elements
-            if self._needs_spacing_after(element, screenplay_elements, i):
-                lines.append("")
-
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.write('\n'.join(lines))
+            if self._needs_spacing_after(element, next_type):
+                yield ''
 
     def _format_title_page(self, elements: List[ScreenplayElement]) -> List[str]:
         """Format title page elements."""
@@ -138,151 +283,186 @@ class TextFormatter(BaseFormatter):
 
     def _format_element(self, element: ScreenplayElement) -> List[str]:
         """Format a single screenplay element."""
-        if element.type == ElementType.BLANK:
-            return []
-
-        if element.type == ElementType.SCENE_HEADING:
-            scene_heading = element.content.upper()
-            if self.include_scene_numbers and element.scene_number:
-                # Add scene number on both sides (industry standard)
-                scene_heading = f"{element.scene_number}   {scene_heading}   {element.scene_number}"
-            return [scene_heading]
-
-        if element.type == ElementType.ACTION:
-            return self._wrap_text(element.content, 0, self.page_width_chars)
-
-        if element.type == ElementType.CHARACTER:
-            # Center the character name
-            return [element.content.upper().center(self.page_width_chars).rstrip()]
-
-        if element.type == ElementType.DIALOGUE:
-            return self._wrap_text(
-                element.content,
-                self.dialogue_left_indent,
-                self.dialogue_right_margin
-            )
-
-        if element.type == ElementType.PARENTHETICAL:
-            return self._wrap_text(
-                element.content,
-                self.parenthetical_indent,
-                self.dialogue_right_margin
-            )
-
-        if element.type == ElementType.TRANSITION:
-            # FADE IN: is left-aligned, all other transitions are right-aligned
-            if element.content.upper().strip() == "FADE IN:":
-                return [element.content.upper()]
-            else:
-                # Right-align other transitions
-                return [element.content.upper().rjust(self.transition_position)]
-
-        if element.type in [ElementType.MONTAGE_BEGIN, ElementType.MONTAGE_END]:
-            return [element.content.upper()]
-
-        if element.type in [ElementType.TITLE, ElementType.CHYRON]:
-            return [element.content.upper()]
-
-        if element.type == ElementType.SHOT:
-            return [element.content.upper()]
-
-        if element.type == ElementType.PAGE_BREAK:
-            return ["\n" * 3]  # Force page break with extra spacing
-
-        if element.type in [ElementType.DUAL_DIALOGUE_LEFT, ElementType.DUAL_DIALOGUE_RIGHT]:
-            # Dual dialogue - these will be handled specially in post-processing
-            return [element.content.upper().center(self.page_width_chars // 2).rstrip()]
-
-        if element.type == ElementType.VFX_SFX:
-            # Format VFX/SFX as action but keep brackets
-            return [element.content.upper()]
-
-        if element.type == ElementType.MORE:
-            # Format (MORE) centered
-            return [element.content.center(self.page_width_chars).rstrip()]
-
-        return [element.content]
+        handler = self._ELEMENT_HANDLERS.get(element.type)
+        if handler is None:
+            return [element.content]
+        return handler(self, element)
+
+    def _format_blank(self, element: ScreenplayElement) -> List[str]:
+        return []
+
+    def _format_scene_heading(self, element: ScreenplayElement) -> List[str]:
+        scene_heading = element.content_upper
+        if self.include_scene_numbers and element.scene_number:
+            # Add scene number on both sides (industry standard)
+            scene_heading = f"{element.scene_number}   {scene_heading}   {element.scene_number}"
+        return [scene_heading]
+
+    def _format_action(self, element: ScreenplayElement) -> List[str]:
+        return self._wrap_text(element.content, 0, self.page_width_chars)
+
+    def _format_character(self, element: ScreenplayElement) -> List[str]:
+        # Center the character name
+        return [element.content_upper.center(self.page_width_chars).rstrip()]
+
+    def _format_dialogue(self, element: ScreenplayElement) -> List[str]:
+        return self._wrap_text(
+            element.content,
+            self.dialogue_left_indent,
+            self.dialogue_right_margin
+        )
+
+    def _format_parenthetical(self, element: ScreenplayElement) -> List[str]:
+        return self._wrap_text(
+            element.content,
+            self.parenthetical_indent,
+            self.dialogue_right_margin
+        )
+
+    def _format_transition(self, element: ScreenplayElement) -> List[str]:
+        # FADE IN: is left-aligned, all other transitions are right-aligned
+        if element.content_upper.strip() == "FADE IN:":
+            return [element.content_upper]
+        else:
+            # Right-align other transitions
+            return [element.content_upper.rjust(self.transition_position)]
+
+    def _format_upper(self, element: ScreenplayElement) -> List[str]:
+        # Montage markers, titles, chyrons, shots and VFX/SFX (brackets kept)
+        return [element.content_upper]
+
+    def _format_page_break(self, element: ScreenplayElement) -> List[str]:
+        # Form feed on a line of its own; pagers and printers start a new page there
+        return [PAGE_BREAK_CHAR]
+
+    def _format_dual_dialogue(self, element: ScreenplayElement) -> List[str]:
+        # Dual dialogue - these will be handled specially in post-processing
+        return [element.content_upper.center(self.page_width_chars // 2).rstrip()]
+
+    def _format_more(self, element: ScreenplayElement) -> List[str]:
+        # Format (MORE) centered
+        return [element.content.center(self.page_width_chars).rstrip()]
+
+    # One dict lookup per element instead of walking an if-chain of type checks
+    _ELEMENT_HANDLERS = {
+        ElementType.BLANK: _format_blank,
+        ElementType.SCENE_HEADING: _format_scene_heading,
+        ElementType.ACTION: _format_action,
+        ElementType.CHARACTER: _format_character,
+        ElementType.DIALOGUE: _format_dialogue,
+        ElementType.PARENTHETICAL: _format_parenthetical,
+        ElementType.TRANSITION: _format_transition,
+        ElementType.MONTAGE_BEGIN: _format_upper,
+        ElementType.MONTAGE_END: _format_upper,
+        ElementType.TITLE: _format_upper,
+        ElementType.CHYRON: _format_upper,
+        ElementType.SHOT: _format_upper,
+        ElementType.PAGE_BREAK: _format_page_break,
+        ElementType.DUAL_DIALOGUE_LEFT: _format_dual_dialogue,
+        ElementType.DUAL_DIALOGUE_RIGHT: _format_dual_dialogue,
+        ElementType.VFX_SFX: _format_upper,
+        ElementType.MORE: _format_more,
+    }
 
     def _wrap_text(self, text: str, left_indent: int, right_margin: int) -> List[str]:
         """Wrap text to fit within margins."""
-        width = right_margin - left_indent
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 > width:
-                if current_line:
-                    lines.append(' ' * left_indent + ' '.join(current_line))
-                current_line = [word]
-                current_length = len(word)
-            else:
-                current_line.append(word)
-                current_length += len(word) + 1
-
-        if current_line:
-            lines.append(' ' * left_indent + ' '.join(current_line))
-
-        return lines
+        indent = ' ' * left_indent
+        wrap = _wrap_words_optimal if self.optimal_wrap else _wrap_words
+        return [indent + line for line in wrap(text, right_margin - left_indent)]
 
     def _needs_spacing_after(self, element: ScreenplayElement,
-                            elements: List[ScreenplayElement],
-                            index: int) -> bool:
-        """Determine if spacing is needed after an element."""
-        if element.type == ElementType.BLANK:
-            return False
-
-        # Look ahead to next non-blank element
-        next_element = None
-        for i in range(index + 1, len(elements)):
-            if elements[i].type != ElementType.BLANK:
-                next_element = elements[i]
-                break
-
-        if not next_element:
+                            next_type: Optional[ElementType]) -> bool:
+        """Determine if spacing is needed after an element, given the next non-blank type."""
+        if element.type == ElementType.BLANK or next_type is None:
             return False
 
-        # Add spacing after scene headings
-        if element.type == ElementType.SCENE_HEADING:
-            return True
-
-        # Add spacing after shot headers
-        if element.type == ElementType.SHOT:
+        # Scene headings, shot headers and transitions are always followed by a blank line
+        if element.type in self._ALWAYS_SPACED_TYPES:
             return True
 
         # Add spacing after action blocks
-        if element.type == ElementType.ACTION and next_element.type != ElementType.ACTION:
+        if element.type == ElementType.ACTION and next_type != ElementType.ACTION:
             return True
 
-        # Add spacing after dialogue blocks
-        if element.type in [ElementType.DIALOGUE, ElementType.PARENTHETICAL]:
-            if next_element.type not in [ElementType.DIALOGUE, ElementType.PARENTHETICAL]:
-                return True
-
-        # Add spacing after transitions
-        if element.type == ElementType.TRANSITION:
-            return True
-
-        # Add spacing before CHARACTER names (professional standard)
-        if next_element.type in [ElementType.CHARACTER, ElementType.DUAL_DIALOGUE_LEFT, ElementType.DUAL_DIALOGUE_RIGHT]:
-            if element.type not in [ElementType.PARENTHETICAL, ElementType.DIALOGUE]:
-                return True
-
-        # No spacing after page breaks (they create their own)
-        if element.type == ElementType.PAGE_BREAK:
-            return False
-
-        return False
+        # Add spacing after dialogue blocks, and before CHARACTER names
+        # (professional standard) unless they continue a dialogue block
+        if element.type in self._DIALOGUE_TYPES:
+            return next_type not in self._DIALOGUE_TYPES
+        return next_type in self._CHARACTER_TYPES
 
 
 class DocxFormatter(BaseFormatter):
     """Format screenplay as DOCX with proper styles."""
 
+    STYLE_MAP = {
+        ElementType.SCENE_HEADING: 'SceneHeading',
+        ElementType.ACTION: 'Action',
+        ElementType.CHARACTER: 'Character',
+        ElementType.DIALOGUE: 'Dialogue',
+        ElementType.PARENTHETICAL: 'Parenthetical',
+        ElementType.TRANSITION: 'Transition',
+        ElementType.SHOT: 'Shot',
+        ElementType.DUAL_DIALOGUE_LEFT: 'Character',
+        ElementType.DUAL_DIALOGUE_RIGHT: 'Character',
+        ElementType.MONTAGE_BEGIN: 'SceneHeading',
+        ElementType.MONTAGE_END: 'SceneHeading',
+        ElementType.TITLE: 'Action',
+        ElementType.CHYRON: 'Action',
+        ElementType.VFX_SFX: 'Action',
+        ElementType.MORE: 'Character',
+    }
+
+    # (style name, font attributes, paragraph format attributes); every style
+    # also gets the Courier 12pt body font
+    STYLE_SPECS = (
+        ('SceneHeading', {'bold': False}, {
+            'alignment': WD_ALIGN_PARAGRAPH.LEFT, 'space_after': _PT12,
+        }),
+        ('Action', {}, {
+            'alignment': WD_ALIGN_PARAGRAPH.LEFT, 'space_after': _PT12,
+        }),
+        ('Character', {}, {
+            'alignment': WD_ALIGN_PARAGRAPH.CENTER, 'space_before': _PT12, 'space_after': _PT0,
+        }),
+        ('Dialogue', {}, {
+            'left_indent': _INCHES[1.0], 'right_indent': _INCHES[1.5], 'space_after': _PT0,
+        }),
+        ('Parenthetical', {}, {
+            'left_indent': _INCHES[1.6], 'right_indent': _INCHES[2.0], 'space_after': _PT0,
+        }),
+        ('Transition', {}, {
+            'alignment': WD_ALIGN_PARAGRAPH.RIGHT, 'space_before': _PT12, 'space_after': _PT12,
+        }),
+        ('Shot', {}, {
+            'alignment': WD_ALIGN_PARAGRAPH.LEFT, 'space_before': _PT12, 'space_after': _PT12,
+        }),
+    )
+
+    UPPERCASE_TYPES = frozenset({
+        ElementType.SCENE_HEADING, ElementType.CHARACTER, ElementType.TRANSITION,
+        ElementType.MONTAGE_BEGIN, ElementType.MONTAGE_END, ElementType.VFX_SFX,
+    })
+
+    KEEP_WITH_NEXT_TYPES = frozenset({
+        ElementType.CHARACTER, ElementType.DIALOGUE,
+        ElementType.PARENTHETICAL, ElementType.SCENE_HEADING,
+    })
+
     def __init__(self, include_scene_numbers: bool = False):
         super().__init__()
         self.include_scene_numbers = include_scene_numbers
 
+        # Lengths are immutable, so they are built once and shared by every document
+        self._font_size = Pt(self.FONT_SIZE)
+        self._page_layout = {
+            'page_height': Inches(self.PAGE_HEIGHT),
+            'page_width': Inches(self.PAGE_WIDTH),
+            'left_margin': Inches(self.LEFT_MARGIN),
+            'right_margin': Inches(self.RIGHT_MARGIN),
+            'top_margin': Inches(self.TOP_MARGIN),
+            'bottom_margin': Inches(self.BOTTOM_MARGIN),
+        }
+
     def format(self, elements: List[ScreenplayElement], output_path: str):
         """Format screenplay elements as DOCX."""
         doc = Document()
@@ -290,36 +470,46 @@ class DocxFormatter(BaseFormatter):
         self._create_styles(doc)
 
         # Separate title page elements from screenplay body
-        title_page_elements = [e for e in elements if e.type in [
-            ElementType.TITLE_PAGE_TITLE, ElementType.TITLE_PAGE_AUTHOR,
-            ElementType.TITLE_PAGE_CONTACT, ElementType.TITLE_PAGE_CREDIT
-        ]]
-        screenplay_elements = [e for e in elements if e not in title_page_elements]
+        title_page_elements, screenplay_elements = self._split_title_page(elements)
+
+        # Resolve each style name to its id once instead of once per paragraph
+        style_ids = {name: doc.styles.get_style_id(name, WD_STYLE_TYPE.PARAGRAPH)
+                     for name in set(self.STYLE_MAP.values()) | {'Normal'}}
 
         # Add title page if present
+        paragraphs = []
         if title_page_elements:
-            self._add_title_page(doc, title_page_elements)
-            doc.add_page_break()
-
-        for i, element in enumerate(screenplay_elements):
-            self._add_element(doc, element)
+            paragraphs.extend(self._title_page_paragraphs(title_page_elements))
+        next_types = _next_non_blank_types(screenplay_elements)
+        for element, next_type in zip(screenplay_elements, next_types):
+            paragraph = self._element_paragraph(element, style_ids)
+            if paragraph is not None:
+                paragraphs.append(paragraph)
 
             # Add spacing between elements
-            if self._needs_spacing_after(element, screenplay_elements, i):
-                doc.add_paragraph()
-
-        doc.save(output_path)
+            if self._needs_spacing_after(element, next_type):
+                paragraphs.append(OxmlElement('w:p'))
+
+        # Attach the body in one go; doc.add_paragraph() searches the whole body
+        # for the section properties on every call, which is quadratic overall
+        body = doc.element.body
+        sect_pr = body.sectPr
+        body.extend(paragraphs)
+        if sect_pr is not None:
+            body.append(sect_pr)  # Section properties must stay the last child
+
+        # The package is zipped part by part in many small writes; assemble it in
+        # memory and write it out in one call, so a failed save leaves no partial file
+        buf = io.BytesIO()
+        doc.save(buf)
+        Path(output_path).write_bytes(buf.getbuffer())
 
     def _setup_page(self, doc: Document):
         """Set up page layout with page numbering."""
         sections = doc.sections
         for section in sections:
-            section.page_height = Inches(self.PAGE_HEIGHT)
-            section.page_width = Inches(self.PAGE_WIDTH)
-            section.left_margin = Inches(self.LEFT_MARGIN)
-            section.right_margin = Inches(self.RIGHT_MARGIN)
-            section.top_margin = Inches(self.TOP_MARGIN)
-            section.bottom_margin = Inches(self.BOTTOM_MARGIN)
+            for attr, length in self._page_layout.items():
+                setattr(section, attr, length)
 
             # Add page numbering in header (top right, industry standard)
             header = section.header
@@ -328,9 +518,6 @@ class DocxFormatter(BaseFormatter):
             header_run = header_para.add_run()
 
             # Add page number field (shows current page number)
-            from docx.oxml import OxmlElement
-            from docx.oxml.ns import qn
-
             fldChar1 = OxmlElement('w:fldChar')
             fldChar1.set(qn('w:fldCharType'), 'begin')
 
@@ -345,11 +532,11 @@ class DocxFormatter(BaseFormatter):
             header_run._r.append(instrText)
             header_run._r.append(fldChar2)
             header_run.font.name = self.FONT_NAME
-            header_run.font.size = Pt(self.FONT_SIZE)
+            header_run.font.size = self._font_size
             header_para.add_run('.')  # Add period after page number
 
-    def _add_title_page(self, doc: Document, elements: List[ScreenplayElement]):
-        """Add title page to document."""
+    def _title_page_paragraphs(self, elements: List[ScreenplayElement]) -> list:
+        """Build the title page as w:p elements, ending with its page break."""
         # Extract elements
         title = None
         author = None
@@ -367,164 +554,103 @@ class DocxFormatter(BaseFormatter):
                 credit = elem.content
 
         # Add vertical spacing
-        for _ in range(10):
-            doc.add_paragraph()
+        paragraphs = [OxmlElement('w:p') for _ in range(10)]
 
         # Title (centered, uppercase)
         if title:
-            title_para = doc.add_paragraph(title.upper())
-            title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            title_para.runs[0].font.name = self.FONT_NAME
-            title_para.runs[0].font.size = Pt(self.FONT_SIZE)
-            title_para.runs[0].font.bold = False
-            doc.add_paragraph()
+            paragraphs.append(self._title_page_line(title.upper(), WD_ALIGN_PARAGRAPH.CENTER, bold=False))
+            paragraphs.append(OxmlElement('w:p'))
 
         # Credit line (centered)
         if credit:
-            credit_para = doc.add_paragraph(credit)
-            credit_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            credit_para.runs[0].font.name = self.FONT_NAME
-            credit_para.runs[0].font.size = Pt(self.FONT_SIZE)
-            doc.add_paragraph()
+            paragraphs.append(self._title_page_line(credit, WD_ALIGN_PARAGRAPH.CENTER))
+            paragraphs.append(OxmlElement('w:p'))
 
         # Author (centered)
         if author:
-            author_para = doc.add_paragraph(author)
-            author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            author_para.runs[0].font.name = self.FONT_NAME
-            author_para.runs[0].font.size = Pt(self.FONT_SIZE)
+            paragraphs.append(self._title_page_line(author, WD_ALIGN_PARAGRAPH.CENTER))
 
         # Add more spacing to push contact info down
-        for _ in range(15):
-            doc.add_paragraph()
+        paragraphs.extend(OxmlElement('w:p') for _ in range(15))
 
         # Contact info (bottom right)
-        if contact:
-            for contact_line in contact:
-                contact_para = doc.add_paragraph(contact_line)
-                contact_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                contact_para.runs[0].font.name = self.FONT_NAME
-                contact_para.runs[0].font.size = Pt(self.FONT_SIZE)
+        for contact_line in contact:
+            paragraphs.append(self._title_page_line(contact_line, WD_ALIGN_PARAGRAPH.RIGHT))
+
+        paragraphs.append(self._page_break_paragraph())
+        return paragraphs
+
+    def _title_page_line(self, text: str, alignment: WD_ALIGN_PARAGRAPH,
+                         bold: Optional[bool] = None):
+        """Build a title page paragraph holding one run in the body font."""
+        # Detached paragraph: it is attached with the rest of the body in format()
+        paragraph = Paragraph(OxmlElement('w:p'), None)
+        run = paragraph.add_run(text)
+        paragraph.alignment = alignment
+        run.font.name = self.FONT_NAME
+        run.font.size = self._font_size
+        if bold is not None:
+            run.font.bold = bold
+        return paragraph._p
+
+    @staticmethod
+    def _page_break_paragraph():
+        """Build a paragraph holding only a page break."""
+        paragraph = OxmlElement('w:p')
+        paragraph.add_r().add_br().type = 'page'
+        return paragraph
 
     def _create_styles(self, doc: Document):
         """Create custom styles for screenplay elements."""
         styles = doc.styles
 
-        # Scene Heading style
-        scene_style = styles.add_style('SceneHeading', WD_STYLE_TYPE.PARAGRAPH)
-        scene_style.font.name = self.FONT_NAME
-        scene_style.font.size = Pt(self.FONT_SIZE)
-        scene_style.font.bold = False
-        scene_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        scene_style.paragraph_format.space_after = Pt(12)
-
-        # Action style
-        action_style = styles.add_style('Action', WD_STYLE_TYPE.PARAGRAPH)
-        action_style.font.name = self.FONT_NAME
-        action_style.font.size = Pt(self.FONT_SIZE)
-        action_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        action_style.paragraph_format.space_after = Pt(12)
-
-        # Character style
-        char_style = styles.add_style('Character', WD_STYLE_TYPE.PARAGRAPH)
-        char_style.font.name = self.FONT_NAME
-        char_style.font.size = Pt(self.FONT_SIZE)
-        char_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        char_style.paragraph_format.space_before = Pt(12)
-        char_style.paragraph_format.space_after = Pt(0)
-
-        # Dialogue style
-        dialogue_style = styles.add_style('Dialogue', WD_STYLE_TYPE.PARAGRAPH)
-        dialogue_style.font.name = self.FONT_NAME
-        dialogue_style.font.size = Pt(self.FONT_SIZE)
-        dialogue_style.paragraph_format.left_indent = Inches(1.0)
-        dialogue_style.paragraph_format.right_indent = Inches(1.5)
-        dialogue_style.paragraph_format.space_after = Pt(0)
-
-        # Parenthetical style
-        paren_style = styles.add_style('Parenthetical', WD_STYLE_TYPE.PARAGRAPH)
-        paren_style.font.name = self.FONT_NAME
-        paren_style.font.size = Pt(self.FONT_SIZE)
-        paren_style.paragraph_format.left_indent = Inches(1.6)
-        paren_style.paragraph_format.right_indent = Inches(2.0)
-        paren_style.paragraph_format.space_after = Pt(0)
-
-        # Transition style
-        trans_style = styles.add_style('Transition', WD_STYLE_TYPE.PARAGRAPH)
-        trans_style.font.name = self.FONT_NAME
-        trans_style.font.size = Pt(self.FONT_SIZE)
-        trans_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        trans_style.paragraph_format.space_before = Pt(12)
-        trans_style.paragraph_format.space_after = Pt(12)
-
-        # Shot style (new)
-        shot_style = styles.add_style('Shot', WD_STYLE_TYPE.PARAGRAPH)
-        shot_style.font.name = self.FONT_NAME
-        shot_style.font.size = Pt(self.FONT_SIZE)
-        shot_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        shot_style.paragraph_format.space_before = Pt(12)
-        shot_style.paragraph_format.space_after = Pt(12)
-
-    def _add_element(self, doc: Document, element: ScreenplayElement):
-        """Add a screenplay element to the document."""
+        for name, font_attrs, paragraph_attrs in self.STYLE_SPECS:
+            style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            style.font.name = self.FONT_NAME
+            style.font.size = self._font_size
+            for attr, value in font_attrs.items():
+                setattr(style.font, attr, value)
+            paragraph_format = style.paragraph_format
+            for attr, value in paragraph_attrs.items():
+                setattr(paragraph_format, attr, value)
+
+    def _element_paragraph(self, element: ScreenplayElement,
+                           style_ids: Dict[str, Optional[str]]):
+        """Build the w:p element for a screenplay element, or None if it adds nothing."""
         if element.type == ElementType.BLANK:
-            return
+            return None
 
         # Handle page breaks
         if element.type == ElementType.PAGE_BREAK:
-            doc.add_page_break()
-            return
-
-        style_map = {
-            ElementType.SCENE_HEADING: 'SceneHeading',
-            ElementType.ACTION: 'Action',
-            ElementType.CHARACTER: 'Character',
-            ElementType.DIALOGUE: 'Dialogue',
-            ElementType.PARENTHETICAL: 'Parenthetical',
-            ElementType.TRANSITION: 'Transition',
-            ElementType.SHOT: 'Shot',
-            ElementType.DUAL_DIALOGUE_LEFT: 'Character',
-            ElementType.DUAL_DIALOGUE_RIGHT: 'Character',
-            ElementType.MONTAGE_BEGIN: 'SceneHeading',
-            ElementType.MONTAGE_END: 'SceneHeading',
-            ElementType.TITLE: 'Action',
-            ElementType.CHYRON: 'Action',
-            ElementType.VFX_SFX: 'Action',
-            ElementType.MORE: 'Character',
-        }
+            return self._page_break_paragraph()
+
+        paragraph = OxmlElement('w:p')
 
-        style = style_map.get(element.type, 'Normal')
+        style = self.STYLE_MAP.get(element.type, 'Normal')
 
         # Format content based on type
         content = element.content
-        if element.type in [ElementType.SCENE_HEADING, ElementType.CHARACTER,
-                           ElementType.TRANSITION, ElementType.MONTAGE_BEGIN,
-                           ElementType.MONTAGE_END, ElementType.VFX_SFX]:
-            content = content.upper()
+        if element.type in self.UPPERCASE_TYPES:
+            content = element.content_upper
 
         # Add scene numbers if enabled
         if element.type == ElementType.SCENE_HEADING and self.include_scene_numbers and element.scene_number:
             content = f"{element.scene_number}   {content}   {element.scene_number}"
 
-        paragraph = doc.add_paragraph(content, style=style)
+        if content:
+            paragraph.add_r().text = content
+        paragraph.style = style_ids[style]
 
-        # Add page break protection for dialogue blocks and scene headings
-        if element.type == ElementType.CHARACTER:
-            # Keep character name with following dialogue
-            paragraph.paragraph_format.keep_with_next = True
-        elif element.type == ElementType.DIALOGUE:
-            # Keep dialogue lines together
-            paragraph.paragraph_format.keep_with_next = True
-        elif element.type == ElementType.PARENTHETICAL:
-            # Keep parentheticals with character/dialogue
-            paragraph.paragraph_format.keep_with_next = True
-        elif element.type == ElementType.SCENE_HEADING:
-            # Keep scene headings with following action
-            paragraph.paragraph_format.keep_with_next = True
+        # Add page break protection for dialogue blocks and scene headings:
+        # character names, dialogue and parentheticals stay with what follows,
+        # and scene headings stay with the following action
+        if element.type in self.KEEP_WITH_NEXT_TYPES:
+            paragraph.get_or_add_pPr().keepNext_val = True
+
+        return paragraph
 
     def _needs_spacing_after(self, element: ScreenplayElement,
-                            elements: List[ScreenplayElement],
-                            index: int) -> bool:
+                            next_type: Optional[ElementType]) -> bool:
         """Determine if spacing is needed after an element."""
         # Similar logic to TextFormatter but adjusted for DOCX
         return False  # Spacing is handled by styles in DOCX
@@ -533,32 +659,38 @@ class DocxFormatter(BaseFormatter):
 class PdfFormatter(BaseFormatter):
     """Format screenplay as PDF with pagination."""
 
-    def __init__(self, include_scene_numbers: bool = False):
+    def __init__(self, include_scene_numbers: bool = False, optimal_wrap: bool = False):
         super().__init__()
         self.lines_per_page = 55
         self.line_height = 12  # points
         self.current_page = 1
         self.current_y = 0
         self.include_scene_numbers = include_scene_numbers
+        self.optimal_wrap = optimal_wrap
+
+        # Page positions in points, converted from inches once
+        self._left_x = self.LEFT_MARGIN * inch
+        self._right_edge = self.PAGE_WIDTH * inch - self.RIGHT_MARGIN * inch
+        self._top_y = self.PAGE_HEIGHT * inch - self.TOP_MARGIN * inch
+        self._bottom_y = self.BOTTOM_MARGIN * inch
+        self._page_number_y = self.PAGE_HEIGHT * inch - 0.5 * inch
+        self._dialog_x = self.DIALOGUE_LEFT_INDENT * inch
+        self._paren_x = self.PARENTHETICAL_INDENT * inch
+        self._char_center_x = (self.PAGE_WIDTH * inch) / 2
+
+        # Courier is monospaced: printable ASCII text is measured as a length
+        # times one glyph width, without going through the font-metrics lookup
+        widths = set(pdfmetrics.getFont("Courier").widths[32:127])
+        self._glyph_width = widths.pop() if len(widths) == 1 else None
 
     def format(self, elements: List[ScreenplayElement], output_path: str):
         """Format screenplay elements as PDF."""
         c = canvas.Canvas(output_path, pagesize=letter)
-
-        # Try to register Courier font
-        try:
-            from reportlab.pdfbase.pdfmetrics import registerFont
-            from reportlab.pdfbase.ttfonts import TTFont
-            # This would need the actual Courier font file
-            c.setFont("Courier", self.FONT_SIZE)
-        except:
-            # Fall back to Courier which should be built-in
-            c.setFont("Courier", self.FONT_SIZE)
-
         self._start_new_page(c)
 
+        self._block_heights = self._precompute_block_heights(elements)
         for i, element in enumerate(elements):
-            self._add_element(c, element, elements, i)
+            self._add_element(c, element, i)
 
         c.save()
 
@@ -566,151 +698,194 @@ class PdfFormatter(BaseFormatter):
         """Start a new page."""
         if self.current_page > 1:
             c.showPage()
-            c.setFont("Courier", self.FONT_SIZE)
+
+        # Courier is one of the built-in PDF fonts; showPage() resets the font
+        c.setFont("Courier", self.FONT_SIZE, leading=self.line_height)
+
+        if self.current_page > 1:
             # Add page number
-            c.drawRightString(
-                self.PAGE_WIDTH * inch - self.RIGHT_MARGIN * inch,
-                self.PAGE_HEIGHT * inch - 0.5 * inch,
-                str(self.current_page)
-            )
+            c.drawRightString(self._right_edge, self._page_number_y, str(self.current_page))
 
-        self.current_y = self.PAGE_HEIGHT * inch - self.TOP_MARGIN * inch
+        self.current_y = self._top_y
         self.current_page += 1
 
-    def _add_element(self, c: canvas.Canvas, element: ScreenplayElement,
-                    elements: List[ScreenplayElement], index: int):
+    def _add_element(self, c: canvas.Canvas, element: ScreenplayElement, index: int):
         """Add element to PDF."""
-        if element.type == ElementType.BLANK:
-            self._move_down(c, 1)
-            return
-
         # Check for blocks that shouldn't break across pages
         if element.type == ElementType.CHARACTER:
-            dialogue_block_height = self._calculate_dialogue_block_height(elements, index)
-            if dialogue_block_height > 0 and self.current_y - dialogue_block_height < self.BOTTOM_MARGIN * inch:
+            dialogue_block_height = self._block_heights.get(index, 0)
+            if dialogue_block_height > 0 and self.current_y - dialogue_block_height < self._bottom_y:
                 # Start new page if dialogue block won't fit
                 self._start_new_page(c)
         elif element.type == ElementType.SCENE_HEADING:
             # Scene headings need at least 3 lines of space after them
             required_space = self.line_height * 3
-            if self.current_y - required_space < self.BOTTOM_MARGIN * inch:
+            if self.current_y - required_space < self._bottom_y:
                 self._start_new_page(c)
 
-        # Format based on element type
-        if element.type == ElementType.SCENE_HEADING:
-            scene_heading = element.content.upper()
-            if self.include_scene_numbers and element.scene_number:
-                scene_heading = f"{element.scene_number}   {scene_heading}   {element.scene_number}"
-            self._add_text(c, scene_heading, self.LEFT_MARGIN * inch)
-            self._move_down(c, 2)
-
-        elif element.type == ElementType.ACTION:
-            lines = self._wrap_pdf_text(element.content, 65)
-            for line in lines:
-                self._add_text(c, line, self.LEFT_MARGIN * inch)
-                self._move_down(c, 1)
-            self._move_down(c, 1)
-
-        elif element.type == ElementType.CHARACTER:
-            # Center character name
-            text_width = c.stringWidth(element.content.upper(), "Courier", self.FONT_SIZE)
-            x_pos = (self.PAGE_WIDTH * inch) / 2 - text_width / 2
-            self._add_text(c, element.content.upper(), x_pos)
-            self._move_down(c, 1)
-
-        elif element.type == ElementType.DIALOGUE:
-            lines = self._wrap_pdf_text(element.content, 35)
-            for line in lines:
-                self._add_text(c, line, self.DIALOGUE_LEFT_INDENT * inch)
-                self._move_down(c, 1)
-
-        elif element.type == ElementType.PARENTHETICAL:
-            lines = self._wrap_pdf_text(element.content, 25)
-            for line in lines:
-                self._add_text(c, line, self.PARENTHETICAL_INDENT * inch)
-                self._move_down(c, 1)
-
-        elif element.type == ElementType.TRANSITION:
-            # FADE IN: is left-aligned, all others are right-aligned
-            if element.content.upper().strip() == "FADE IN:":
-                self._add_text(c, element.content.upper(), self.LEFT_MARGIN * inch)
-            else:
-                # Right align other transitions
-                text_width = c.stringWidth(element.content.upper(), "Courier", self.FONT_SIZE)
-                x_pos = self.PAGE_WIDTH * inch - self.RIGHT_MARGIN * inch - text_width
-                self._add_text(c, element.content.upper(), x_pos)
-            self._move_down(c, 2)
+        # Format based on element type; other types are not drawn
+        handler = self._ELEMENT_HANDLERS.get(element.type)
+        if handler is not None:
+            handler(self, c, element)
+
+    def _draw_blank(self, c: canvas.Canvas, element: ScreenplayElement):
+        self._move_down(c, 1)
+
+    def _draw_scene_heading(self, c: canvas.Canvas, element: ScreenplayElement):
+        scene_heading = element.content_upper
+        if self.include_scene_numbers and element.scene_number:
+            scene_heading = f"{element.scene_number}   {scene_heading}   {element.scene_number}"
+        self._add_text(c, scene_heading, self._left_x)
+        self._move_down(c, 2)
+
+    def _draw_action(self, c: canvas.Canvas, element: ScreenplayElement):
+        self._draw_lines(c, self._wrap_pdf_text(element.content, 65), self._left_x)
+        self._move_down(c, 1)
+
+    def _draw_character(self, c: canvas.Canvas, element: ScreenplayElement):
+        # Center character name
+        text_width = self._text_width(c, element.content_upper)
+        x_pos = self._char_center_x - text_width / 2
+        self._add_text(c, element.content_upper, x_pos)
+        self._move_down(c, 1)
+
+    def _draw_dialogue(self, c: canvas.Canvas, element: ScreenplayElement):
+        self._draw_lines(c, self._wrap_pdf_text(element.content, 35), self._dialog_x)
+
+    def _draw_parenthetical(self, c: canvas.Canvas, element: ScreenplayElement):
+        self._draw_lines(c, self._wrap_pdf_text(element.content, 25), self._paren_x)
+
+    def _draw_transition(self, c: canvas.Canvas, element: ScreenplayElement):
+        # FADE IN: is left-aligned, all others are right-aligned
+        if element.content_upper.strip() == "FADE IN:":
+            self._add_text(c, element.content_upper, self._left_x)
+        else:
+            # Right align other transitions
+            text_width = self._text_width(c, element.content_upper)
+            x_pos = self._right_edge - text_width
+            self._add_text(c, element.content_upper, x_pos)
+        self._move_down(c, 2)
+
+    _ELEMENT_HANDLERS = {
+        ElementType.BLANK: _draw_blank,
+        ElementType.SCENE_HEADING: _draw_scene_heading,
+        ElementType.ACTION: _draw_action,
+        ElementType.CHARACTER: _draw_character,
+        ElementType.DIALOGUE: _draw_dialogue,
+        ElementType.PARENTHETICAL: _draw_parenthetical,
+        ElementType.TRANSITION: _draw_transition,
+    }
 
     def _add_text(self, c: canvas.Canvas, text: str, x_pos: float):
         """Add text at current y position."""
         c.drawString(x_pos, self.current_y, text)
 
+    def _text_width(self, c: canvas.Canvas, text: str) -> float:
+        """Width of text in points at the body font size."""
+        if self._glyph_width is not None and text.isascii() and text.isprintable():
+            # Same arithmetic as reportlab: glyph units * 0.001 * font size
+            return len(text) * self._glyph_width * 0.001 * self.FONT_SIZE
+        # Other characters may come from substitution fonts with other widths
+        return c.stringWidth(text, "Courier", self.FONT_SIZE)
+
+    def _draw_lines(self, c: canvas.Canvas, lines: Sequence[str], x_pos: float):
+        """
+        Draw wrapped lines as one text object per page and move below them.
+
+        One BT/ET block using the canvas leading (set with the font) replaces a
+        drawString, and its own text object, per line. Pages break where
+        _move_down would.
+        """
+        while lines:
+            # Lines that fit before moving down would run past the bottom margin
+            fit = int((self.current_y - self._bottom_y) // self.line_height) + 1
+            page_lines, lines = lines[:fit], lines[fit:]
+            text = c.beginText(x_pos, self.current_y)
+            text.textLines(page_lines, trim=0)
+            c.drawText(text)
+            self._move_down(c, len(page_lines))
+
     def _move_down(self, c: canvas.Canvas, lines: int):
         """Move down by specified number of lines."""
         self.current_y -= self.line_height * lines
 
         # Check if we need a new page
-        if self.current_y < self.BOTTOM_MARGIN * inch:
+        if self.current_y < self._bottom_y:
             self._start_new_page(c)
 
-    def _wrap_pdf_text(self, text: str, max_chars: int) -> List[str]:
+    def _wrap_pdf_text(self, text: str, max_chars: int) -> Sequence[str]:
         """Wrap text to fit within character limit."""
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 > max_chars:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = len(word)
-            else:
-                current_line.append(word)
-                current_length += len(word) + 1
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Cached: dialogue is wrapped once to measure its block and again to draw it
+        return _wrap_words_cached(text, max_chars, self.optimal_wrap)
 
-        return lines
+    def _precompute_block_heights(self, elements: List[ScreenplayElement]) -> Dict[int, float]:
+        """
+        Calculate the height needed for each complete dialogue block.
 
-    def _calculate_dialogue_block_height(self, elements: List[ScreenplayElement], start_index: int) -> float:
-        """Calculate the height needed for a complete dialogue block."""
-        if start_index >= len(elements) or elements[start_index].type != ElementType.CHARACTER:
-            return 0
+        A single backward pass replaces a look-ahead from every CHARACTER;
+        `tail` is the height of the block continuation after the current index.
 
-        height = 0
-        i = start_index
+        Returns:
+            Dict mapping the index of each CHARACTER element to its block height
+        """
+        heights = {}
+        tail = 0
 
-        # Count lines for character name
-        height += self.line_height
+        for i in range(len(elements) - 1, -1, -1):
+            element = elements[i]
 
-        # Look ahead for dialogue, parentheticals, and continuation
-        while i + 1 < len(elements):
-            next_elem = elements[i + 1]
+            if element.type == ElementType.CHARACTER:
+                # Character name, the rest of the block, and a minimum buffer space
+                heights[i] = self.line_height + tail + self.line_height * 2
 
-            if next_elem.type == ElementType.DIALOGUE:
+            if element.type == ElementType.DIALOGUE:
                 # Count wrapped lines for dialogue
-                lines = self._wrap_pdf_text(next_elem.content, 35)
-                height += len(lines) * self.line_height
-            elif next_elem.type == ElementType.PARENTHETICAL:
+                tail += len(self._wrap_pdf_text(element.content, 35)) * self.line_height
+            elif element.type == ElementType.PARENTHETICAL:
                 # Count wrapped lines for parenthetical
-                lines = self._wrap_pdf_text(next_elem.content, 25)
-                height += len(lines) * self.line_height
-            elif next_elem.type == ElementType.BLANK:
+                tail += len(self._wrap_pdf_text(element.content, 25)) * self.line_height
+            elif element.type == ElementType.BLANK:
                 # Small space between dialogue elements
-                height += self.line_height * 0.5
-            elif next_elem.type == ElementType.CHARACTER and "(CONT'D)" in next_elem.content:
+                tail += self.line_height * 0.5
+            elif element.type == ElementType.CHARACTER and "(CONT'D)" in element.content:
                 # Character continuation - part of same conversation
-                height += self.line_height
+                tail += self.line_height
             else:
-                # End of dialogue block
-                break
-
-            i += 1
-
-        # Add minimum buffer space
-        height += self.line_height * 2
-
-        return height
\ No newline at end of file
+                # A block continuation cannot reach past this element
+                tail = 0
+
+        return heights
+
+
+def write_all(elements: List[ScreenplayElement], base_path: str,
+              include_scene_numbers: bool = False) -> List[str]:
+    """
+    Write the screenplay as .txt, .docx and .pdf side by side.
+
+    The three formatters run in worker threads. Each builds its own output from
+    the shared, read-only element list, and deflate compression plus file writes
+    release the GIL, so the DOCX and PDF saves overlap the other formatters' work.
+
+    Args:
+        elements: Parsed screenplay elements
+        base_path: Output path without extension
+        include_scene_numbers: Add scene numbers to scene headings
+
+    Returns:
+        List of the written file paths
+    """
+    jobs = [
+        (TextFormatter, base_path + '.txt'),
+        (DocxFormatter, base_path + '.docx'),
+        (PdfFormatter, base_path + '.pdf'),
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [
+            executor.submit(formatter_class(include_scene_numbers=include_scene_numbers).format,
+                            elements, output_path)
+            for formatter_class, output_path in jobs
+        ]
+        # Re-raise the first formatter error, if any
+        for future in futures:
+            future.result()
+    return [output_path for _, output_path in jobs]
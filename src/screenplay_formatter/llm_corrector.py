@@ -1,11 +1,15 @@
 """LLM-powered screenplay formatting corrector with anti-hallucination guardrails."""
 
 import os
+import re
 import json
+import asyncio
 import hashlib
 import logging
+import time
 from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from pydantic import BaseModel, Field
 import openai
 
@@ -37,9 +41,61 @@ class ChunkContext:
     """Context for a chunk being processed."""
     start_line: int
     end_line: int
-    lines: List[str]
+    text_lines: List[str] = field(repr=False)  # Full screenplay lines, shared by all chunks
     errors: List[ValidationError]
     elements: List[ScreenplayElement]
+    non_blank_lines: int
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Lines covered by this chunk (sliced from the shared text on first use)."""
+        return self.text_lines[self.start_line:self.end_line + 1]
+
+
+class _FixStreamScanner:
+    """Pull completed fix objects out of a JSON response while it is being streamed."""
+
+    FIXES_START_PATTERN = re.compile(r'"fixes"\s*:\s*\[')
+
+    def __init__(self):
+        self.text = ''
+        self._pos: Optional[int] = None  # Where the next fix object may start
+        self._done = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """Add streamed text and return any fix objects it completed."""
+        self.text += delta
+        if self._done:
+            return []
+
+        if self._pos is None:
+            match = self.FIXES_START_PATTERN.search(self.text)
+            if not match:
+                return []
+            self._pos = match.end()
+        elif '}' not in delta and ']' not in delta:
+            return []  # Can't have finished an object
+
+        text = self.text
+        found = []
+        while True:
+            pos = self._pos
+            while pos < len(text) and text[pos] in ' \t\r\n,':
+                pos += 1
+            self._pos = pos
+            if pos >= len(text):
+                break
+            if text[pos] == ']':
+                self._done = True
+                break
+            try:
+                fix, self._pos = self._decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                break  # Object not complete yet
+            found.append(fix)
+
+        return found
 
 
 class LLMCorrector:
@@ -55,94 +111,32 @@ class LLMCorrector:
         'O.S.', 'V.O.', 'CONT\'D', 'THE END'
     }
 
-    def __init__(self,
-                 api_key: Optional[str] = None,
-                 model: str = "gpt-4o-mini",
-                 temperature: float = 0.0,
-                 top_p: float = 0.1,
-                 min_confidence: float = 0.8,
-                 max_edit_distance: int = 8):
-        """
-        Initialize LLM corrector.
+    # Scene heading prefixes whose trailing period rule fixes may add
+    SCENE_HEADING_PREFIXES = frozenset({'INT', 'EXT', 'INT./EXT', 'EXT./INT', 'I/E'})
 
-        Args:
-            api_key: OpenAI API key (or None to use environment)
-            model: OpenAI model to use
-            temperature: Generation temperature (0.0 for deterministic)
-            top_p: Top-p sampling parameter
-            min_confidence: Minimum confidence for auto-apply
-            max_edit_distance: Maximum allowed edit distance per chunk
-        """
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        if not self.api_key:
-            raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
+    # Extra attempts (with exponential backoff) for concurrent requests hitting rate limits
+    RATE_LIMIT_RETRIES = 4
 
-        self.model = model
-        self.temperature = temperature
-        self.top_p = top_p
-        self.min_confidence = min_confidence
-        self.max_edit_distance = max_edit_distance
+    # Errors that need restructuring rather than local edits; chunks with
+    # these go straight to the strong model when one is configured
+    STRUCTURAL_ERROR_CODES = frozenset({
+        ErrorCode.E6_INVALID_BLOCK_SEQUENCE,
+        ErrorCode.E12_REDUNDANT_CONTENT,
+        ErrorCode.E13_MISPLACED_ACTION_IN_PAREN
+    })
 
-        # Initialize OpenAI client
-        self.client = openai.OpenAI(api_key=self.api_key)
+    # Extra arguments for streamed chat completions (usage arrives in the final chunk)
+    STREAM_ARGS = {"stream": True, "stream_options": {"include_usage": True}}
 
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
+    # Maximum number of LLM responses remembered for identical prompts
+    RESPONSE_CACHE_SIZE = 1024
 
-    def correct_chunk(self, chunk: ChunkContext) -> Tuple[CorrectionResponse, bool]:
-        """
-        Correct a single chunk using LLM.
-
-        Args:
-            chunk: Chunk context with errors and content
-
-        Returns:
-            Tuple of (correction_response, applied_successfully)
-        """
-        # Generate prompt
-        prompt = self._generate_prompt(chunk)
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
-
-        self.logger.info(f"Correcting chunk lines {chunk.start_line}-{chunk.end_line}, "
-                        f"errors: {[e.error_code.value for e in chunk.errors]}, "
-                        f"prompt_hash: {prompt_hash}")
-
-        try:
-            # Call LLM
-            response = self._call_llm(prompt)
-            correction = self._parse_response(response)
-            correction.model = f"{self.model}@{prompt_hash}"
-
-            # Validate and apply corrections
-            if self._validate_correction(chunk, correction):
-                applied = self._apply_correction(chunk, correction)
-                self.logger.info(f"Correction applied: {applied}, "
-                               f"fixes: {len(correction.fixes)}, "
-                               f"avg_confidence: {self._avg_confidence(correction):.2f}")
-                return correction, applied
-            else:
-                self.logger.warning(f"Correction rejected due to validation failure")
-                return correction, False
+    # Batch API statuses after which a batch will not change any more
+    BATCH_FINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
 
-        except Exception as e:
-            self.logger.error(f"LLM correction failed: {e}")
-            # Return empty correction on error
-            return CorrectionResponse(
-                model=self.model,
-                fixes=[],
-                unchanged_lines=list(range(len(chunk.lines))),
-                notes=f"Error: {str(e)[:100]}"
-            ), False
-
-    def _generate_prompt(self, chunk: ChunkContext) -> str:
-        """Generate the correction prompt for a chunk."""
-        # Extract error codes
-        error_codes = [e.error_code.value for e in chunk.errors]
-
-        # Build input text
-        input_text = '\n'.join(chunk.lines)
-
-        system_prompt = """You are a screenplay formatting corrector. You must enforce industry formatting rules without inventing story content.
+    # Fixed instructions sent ahead of every chunk. They never change between
+    # calls, so the API's automatic prompt caching can reuse the whole prefix.
+    SYSTEM_PROMPT = """You are a screenplay formatting corrector. You must enforce industry formatting rules without inventing story content.
 
 ALLOWED: capitalization, whitespace/indentation normalization; moving lines between blocks; adding missing INT./EXT./TIME only when unambiguous.
 FORBIDDEN: adding words/lines/characters; rewriting dialogue; creative changes.
@@ -150,7 +144,7 @@ FORBIDDEN: adding words/lines/characters; rewriting dialogue; creative changes.
 If uncertain, output a suggestion with low confidence rather than altering the text.
 Output strictly as JSON matching the provided schema. No prose."""
 
-        user_prompt = f"""STYLE_GUIDE (per industry standards):
+    STYLE_GUIDE_PROMPT = """STYLE_GUIDE (per industry standards):
 - Scene headings: ALL CAPS: INT./EXT. + SPECIFIC LOCATION + TIME (DAY/NIGHT/EVENING/CONTINUOUS/LATER).
 - Character names: ALL CAPS, centered (~3.7" from left margin). Must be consistent throughout script.
 - Dialogue: Standard capitalization, indented ~2.5" left, ~1.5" right margin. No text-speak abbreviations (idk, lol, etc).
@@ -205,64 +199,558 @@ REMOVE THESE NON-SCREENPLAY ELEMENTS:
 - Date stamps and technical information
 - Meta-comments: [NOTE TO SELF], [TODO], [FIXME], [DECIDE], [MAYBE]
 
-DETECTED_ISSUES: {', '.join(error_codes)}
-
-INPUT_CHUNK:
-<<<
-{input_text}
->>>
-
 TASK:
 Identify formatting issues, propose minimal fixes, and return JSON with the following schema:
-{{
+{
   "version": "1.0",
   "model": "model_name",
   "fixes": [
-    {{
+    {
       "start_line": 0,
       "end_line": 0,
       "original": ["original line"],
       "revised": ["corrected line"],
       "issues": ["E1", "E2"],
       "confidence": 0.9
-    }}
+    }
   ],
   "unchanged_lines": [1, 2, 3],
   "notes": "Brief explanation"
-}}"""
+}
 
-        return user_prompt  # We'll use system message in the API call
+The chunk to correct and its detected issues follow in the next message."""
 
-    def _call_llm(self, prompt: str) -> str:
-        """Call the OpenAI API with the prompt."""
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a screenplay formatting corrector. You must enforce industry formatting rules without inventing story content.
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: str = "gpt-4o-mini",
+                 temperature: float = 0.0,
+                 top_p: float = 0.1,
+                 min_confidence: float = 0.8,
+                 max_edit_distance: int = 8,
+                 max_concurrency: int = 8,
+                 strong_model: Optional[str] = None):
+        """
+        Initialize LLM corrector.
 
-ALLOWED: capitalization, whitespace/indentation normalization; moving lines between blocks; adding missing INT./EXT./TIME only when unambiguous.
-FORBIDDEN: adding words/lines/characters; rewriting dialogue; creative changes.
+        Args:
+            api_key: OpenAI API key (or None to use environment)
+            model: OpenAI model to use (the fast model when strong_model is set)
+            temperature: Generation temperature (0.0 for deterministic)
+            top_p: Top-p sampling parameter
+            min_confidence: Minimum confidence for auto-apply
+            max_edit_distance: Maximum allowed edit distance per chunk
+            max_concurrency: Maximum number of chunks sent to the API at once
+            strong_model: Larger model for structural errors and low-confidence
+                results (None to always use model)
+        """
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        if not self.api_key:
+            raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
 
-If uncertain, output a suggestion with low confidence rather than altering the text.
-Output strictly as JSON matching the provided schema. No prose."""
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
+        self.model = model
+        self.temperature = temperature
+        self.top_p = top_p
+        self.min_confidence = min_confidence
+        self.max_edit_distance = max_edit_distance
+        self.max_concurrency = max_concurrency
+        self.strong_model = strong_model
+
+        # Raw LLM responses by model, sampling settings and prompt hash, so repeated
+        # chunks (within a run or across runs on this instance) skip the API
+        self._response_cache: Dict[Tuple[str, float, float, str], str] = {}
+
+        # Initialize OpenAI client
+        self.client = openai.OpenAI(api_key=self.api_key)
+
+        # Shared prompt prefix; only the final user message differs per chunk
+        self._static_messages = [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": self.STYLE_GUIDE_PROMPT}
         ]
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=self.temperature,
-            top_p=self.top_p,
-            max_tokens=2000,
-            response_format={"type": "json_object"},
-            stop=["\n\n", "```"]
+        # Setup logging
+        self.logger = logging.getLogger(__name__)
+
+    def correct_chunk(self, chunk: ChunkContext) -> Tuple[CorrectionResponse, bool]:
+        """
+        Correct a single chunk using LLM.
+
+        Args:
+            chunk: Chunk context with errors and content
+
+        Returns:
+            Tuple of (correction_response, applied_successfully)
+        """
+        correction = self._rule_correction(chunk)
+        if correction is not None:
+            return correction, self._apply_correction(chunk, correction)
+
+        prompt, prompt_hash = self._prepare_prompt(chunk)
+        model = self._select_model(chunk)
+
+        try:
+            correction, stopped = self._request_correction(prompt, prompt_hash, model)
+            if self._should_escalate(model, correction, stopped):
+                model = self.strong_model
+                correction, stopped = self._request_correction(prompt, prompt_hash, model)
+            if stopped:
+                return self._stopped_correction(chunk, correction)
+            return self._validate_and_apply(chunk, correction)
+        except Exception as e:
+            return self._failed_correction(chunk, e)
+
+    async def correct_chunk_async(self, chunk: ChunkContext,
+                                  client: openai.AsyncOpenAI) -> Tuple[CorrectionResponse, bool]:
+        """
+        Correct a single chunk using LLM without blocking the event loop.
+
+        Args:
+            chunk: Chunk context with errors and content
+            client: Async OpenAI client to send the request with
+
+        Returns:
+            Tuple of (correction_response, applied_successfully)
+        """
+        correction = self._rule_correction(chunk)
+        if correction is not None:
+            return correction, self._apply_correction(chunk, correction)
+
+        prompt, prompt_hash = self._prepare_prompt(chunk)
+        model = self._select_model(chunk)
+
+        try:
+            correction, stopped = await self._request_correction_async(prompt, prompt_hash, model, client)
+            if self._should_escalate(model, correction, stopped):
+                model = self.strong_model
+                correction, stopped = await self._request_correction_async(prompt, prompt_hash, model, client)
+            if stopped:
+                return self._stopped_correction(chunk, correction)
+            return self._validate_and_apply(chunk, correction)
+        except Exception as e:
+            return self._failed_correction(chunk, e)
+
+    def correct_chunks(self, chunks: List[ChunkContext]) -> List[Tuple[CorrectionResponse, bool]]:
+        """
+        Correct several chunks, sending up to max_concurrency requests at once.
+
+        Args:
+            chunks: Chunks to correct
+
+        Returns:
+            List of (correction_response, applied_successfully) in chunk order
+        """
+        if len(chunks) <= 1 or self.max_concurrency <= 1:
+            return [self.correct_chunk(chunk) for chunk in chunks]
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._correct_chunks_async(chunks))
+
+        # Already inside an event loop (e.g. a notebook); asyncio.run can't nest
+        return [self.correct_chunk(chunk) for chunk in chunks]
+
+    async def _correct_chunks_async(self, chunks: List[ChunkContext]) -> List[Tuple[CorrectionResponse, bool]]:
+        """Run chunk corrections concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with openai.AsyncOpenAI(api_key=self.api_key) as client:
+            async def correct(chunk: ChunkContext) -> Tuple[CorrectionResponse, bool]:
+                async with semaphore:
+                    return await self.correct_chunk_async(chunk, client)
+
+            return await asyncio.gather(*(correct(chunk) for chunk in chunks))
+
+    def correct_chunks_batch(self, chunks: List[ChunkContext],
+                             poll_interval: float = 30.0) -> List[Tuple[CorrectionResponse, bool]]:
+        """
+        Correct chunks through the OpenAI Batch API.
+
+        Batch requests cost less and have higher rate limits, but may take
+        up to 24 hours, so this is meant for offline runs over whole scripts.
+
+        Args:
+            chunks: Chunks to correct
+            poll_interval: Seconds to wait between batch status checks
+
+        Returns:
+            List of (correction_response, applied_successfully) in chunk order
+        """
+        results: List[Optional[Tuple[CorrectionResponse, bool]]] = [None] * len(chunks)
+        pending = []  # (index, prompt, prompt_hash, model) of chunks that need the API
+        for i, chunk in enumerate(chunks):
+            correction = self._rule_correction(chunk)
+            if correction is not None:
+                results[i] = correction, self._apply_correction(chunk, correction)
+                continue
+
+            prompt, prompt_hash = self._prepare_prompt(chunk)
+            model = self._select_model(chunk)
+            response = self._cached_response(model, prompt_hash)
+            if response is not None:
+                results[i] = self._validate_and_apply(
+                    chunk, self._parse_correction(response, prompt_hash, model))
+            else:
+                pending.append((i, prompt, prompt_hash, model))
+
+        if not pending:
+            return results
+
+        try:
+            batch_results = self._run_batch(pending, poll_interval)
+        except Exception as e:
+            for i, _, _, _ in pending:
+                results[i] = self._failed_correction(chunks[i], e)
+            return results
+
+        for i, _, prompt_hash, model in pending:
+            try:
+                result = batch_results.get(f"chunk-{i}")
+                if result is None:
+                    raise RuntimeError(f"No batch result for chunk {i}")
+                response = result.get("response") or {}
+                if result.get("error") or response.get("status_code") != 200:
+                    raise RuntimeError(f"Batch request failed: {result.get('error') or response.get('body')}")
+                content = response["body"]["choices"][0]["message"]["content"]
+                self._cache_response(model, prompt_hash, content)
+                results[i] = self._validate_and_apply(
+                    chunks[i], self._parse_correction(content, prompt_hash, model))
+            except Exception as e:
+                results[i] = self._failed_correction(chunks[i], e)
+
+        return results
+
+    def _run_batch(self, pending: List[Tuple[int, str, str, str]], poll_interval: float) -> Dict[str, Dict[str, Any]]:
+        """Submit prompts as one batch, wait for it, and return its results by custom_id."""
+        requests = '\n'.join(
+            json.dumps({
+                "custom_id": f"chunk-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request(prompt, model)
+            })
+            for i, prompt, _, model in pending
         )
 
-        return response.choices[0].message.content
+        input_file = self.client.files.create(
+            file=("chunks.jsonl", requests.encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self.logger.info(f"Submitted batch {batch.id} with {len(pending)} chunks")
+
+        while batch.status not in self.BATCH_FINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        # Expired batches may still have finished some requests
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        output = self.client.files.content(batch.output_file_id).text
+
+        batch_results = {}
+        for line in output.splitlines():
+            if line.strip():
+                result = json.loads(line)
+                batch_results[result["custom_id"]] = result
+        return batch_results
+
+    def _prepare_prompt(self, chunk: ChunkContext) -> Tuple[str, str]:
+        """Generate the prompt for a chunk and log the request."""
+        prompt = self._generate_prompt(chunk)
+        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
+
+        self.logger.info(f"Correcting chunk lines {chunk.start_line}-{chunk.end_line}, "
+                        f"errors: {[e.error_code.value for e in chunk.errors]}, "
+                        f"prompt_hash: {prompt_hash[:8]}")
+
+        return prompt, prompt_hash
+
+    def _select_model(self, chunk: ChunkContext) -> str:
+        """Pick the strong model for structural errors, otherwise the fast one."""
+        if self.strong_model and any(e.error_code in self.STRUCTURAL_ERROR_CODES for e in chunk.errors):
+            return self.strong_model
+        return self.model
+
+    def _should_escalate(self, model: str, correction: CorrectionResponse, stopped: bool = False) -> bool:
+        """Check whether a fast-model correction should be retried with the strong model."""
+        if not self.strong_model or model == self.strong_model:
+            return False
+        if stopped:
+            self.logger.info(f"Escalating to {self.strong_model}: response stopped at a rejected fix")
+            return True
+        if not correction.fixes:
+            return False
+        avg_confidence = self._avg_confidence(correction)
+        if avg_confidence >= self.min_confidence:
+            return False
+        self.logger.info(f"Escalating to {self.strong_model}: avg_confidence {avg_confidence:.2f}")
+        return True
+
+    def _request_correction(self, prompt: str, prompt_hash: str,
+                            model: str) -> Tuple[CorrectionResponse, bool]:
+        """
+        Get a parsed correction from the cache or the API.
+
+        Returns:
+            Tuple of (correction, stopped). A stopped stream isn't cached, and
+            its correction holds only the fixes received before it stopped.
+        """
+        response = self._cached_response(model, prompt_hash)
+        if response is None:
+            response, stopped_fixes = self._call_llm(prompt, model)
+            if stopped_fixes is not None:
+                return self._partial_correction(stopped_fixes, prompt_hash, model), True
+            self._cache_response(model, prompt_hash, response)
+        return self._parse_correction(response, prompt_hash, model), False
+
+    async def _request_correction_async(self, prompt: str, prompt_hash: str, model: str,
+                                        client: openai.AsyncOpenAI) -> Tuple[CorrectionResponse, bool]:
+        """Get a parsed correction from the cache or the API using an async client."""
+        response = self._cached_response(model, prompt_hash)
+        if response is None:
+            response, stopped_fixes = await self._call_llm_async(prompt, client, model)
+            if stopped_fixes is not None:
+                return self._partial_correction(stopped_fixes, prompt_hash, model), True
+            self._cache_response(model, prompt_hash, response)
+        return self._parse_correction(response, prompt_hash, model), False
+
+    def _cached_response(self, model: str, prompt_hash: str) -> Optional[str]:
+        """Return the remembered LLM response for a prompt, if any."""
+        response = self._response_cache.get((model, self.temperature, self.top_p, prompt_hash))
+        if response is not None:
+            self.logger.info(f"Reusing cached response for prompt_hash: {prompt_hash[:8]}")
+        return response
+
+    def _cache_response(self, model: str, prompt_hash: str, response: str):
+        """Remember an LLM response, dropping the oldest entry when full."""
+        if len(self._response_cache) >= self.RESPONSE_CACHE_SIZE:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[(model, self.temperature, self.top_p, prompt_hash)] = response
+
+    def _parse_correction(self, response: str, prompt_hash: str, model: str) -> CorrectionResponse:
+        """Parse an LLM response and tag it with the model and prompt that produced it."""
+        correction = self._parse_response(response)
+        correction.model = f"{model}@{prompt_hash[:8]}"
+        return correction
+
+    @staticmethod
+    def _partial_correction(fixes: List[FixSpan], prompt_hash: str, model: str) -> CorrectionResponse:
+        """Build a correction from the fixes a stopped stream delivered."""
+        return CorrectionResponse(
+            model=f"{model}@{prompt_hash[:8]}",
+            fixes=fixes,
+            unchanged_lines=[],
+            notes="Stopped at a fix that failed validation"
+        )
+
+    def _validate_and_apply(self, chunk: ChunkContext,
+                            correction: CorrectionResponse) -> Tuple[CorrectionResponse, bool]:
+        """Validate a correction and apply it if it passes."""
+        if self._validate_correction(chunk, correction):
+            applied = self._apply_correction(chunk, correction)
+            self.logger.info(f"Correction applied: {applied}, "
+                           f"fixes: {len(correction.fixes)}, "
+                           f"avg_confidence: {self._avg_confidence(correction):.2f}")
+            return correction, applied
+        else:
+            self.logger.warning(f"Correction rejected due to validation failure")
+            return correction, False
+
+    def _rule_correction(self, chunk: ChunkContext) -> Optional[CorrectionResponse]:
+        """
+        Fix a chunk without the LLM when every error is mechanical.
+
+        An error is mechanical when the validator's suggestion differs from
+        the line only in capitalization, spacing and a trailing period/colon
+        on the INT./EXT. prefix or the last word (e.g. 'int coffee shop day'
+        -> 'INT. COFFEE SHOP DAY', 'cut to' -> 'CUT TO:').
+
+        These fixes only change case, spacing and that punctuation by
+        construction, so they skip the edit-distance and added-token checks
+        meant for LLM output. They keep the validator's confidence.
+
+        Returns:
+            Correction with one fix per error, or None if the LLM is needed
+        """
+        if not chunk.errors:
+            return None
+
+        lines = chunk.lines
+        fixes = []
+        fixed_lines = set()
+        for error in chunk.errors:
+            index = error.line_number - 1 - chunk.start_line
+            if not (error.suggestion and 0 <= index < len(lines)) or index in fixed_lines:
+                return None
+
+            line = lines[index]
+            indent = line[:len(line) - len(line.lstrip())]
+            revised = indent + ' '.join(error.suggestion.split())
+            if revised == line or line.split() != error.content.split() or \
+                    not self._is_mechanical(error.content, error.suggestion):
+                return None
+
+            fixes.append(FixSpan(
+                start_line=index,
+                end_line=index,
+                original=[line],
+                revised=[revised],
+                issues=[error.error_code.value],
+                confidence=error.confidence
+            ))
+            fixed_lines.add(index)
+
+        self.logger.info(f"Fixed chunk lines {chunk.start_line}-{chunk.end_line} by rules, "
+                         f"errors: {[e.error_code.value for e in chunk.errors]}")
+        return CorrectionResponse(
+            model="rules",
+            fixes=fixes,
+            unchanged_lines=[i for i in range(len(lines)) if i not in fixed_lines],
+            notes="Mechanical fixes applied without LLM"
+        )
+
+    @classmethod
+    def _is_mechanical(cls, content: str, suggestion: str) -> bool:
+        """Check a suggestion only changes case, spacing and prefix/final punctuation."""
+        words = content.upper().split()
+        suggested = suggestion.split()
+        if not words or len(words) != len(suggested):
+            return False
+
+        for i, (word, new_word) in enumerate(zip(words, suggested)):
+            if word == new_word:
+                continue
+            is_prefix = i == 0 and new_word.rstrip('.:') in cls.SCENE_HEADING_PREFIXES
+            if not (is_prefix or i == len(words) - 1) or \
+                    word.rstrip('.:') != new_word.rstrip('.:'):
+                return False
+        return True
+
+    def _stopped_correction(self, chunk: ChunkContext,
+                            correction: CorrectionResponse) -> Tuple[CorrectionResponse, bool]:
+        """
+        Reject the correction from a response stream that was stopped early.
+
+        The fixes received before the stop (including the one that failed)
+        are kept, so dry runs and suggestions still report them.
+        """
+        self.logger.warning(f"Correction rejected due to validation failure")
+        fixed_lines = {i for fix in correction.fixes for i in range(fix.start_line, fix.end_line + 1)}
+        correction.unchanged_lines = [i for i in range(len(chunk.lines)) if i not in fixed_lines]
+        return correction, False
+
+    def _failed_correction(self, chunk: ChunkContext, error: Exception) -> Tuple[CorrectionResponse, bool]:
+        """Build the empty correction returned when the LLM call fails."""
+        self.logger.error(f"LLM correction failed: {error}")
+        return CorrectionResponse(
+            model=self.model,
+            fixes=[],
+            unchanged_lines=list(range(len(chunk.lines))),
+            notes=f"Error: {str(error)[:100]}"
+        ), False
+
+    def _generate_prompt(self, chunk: ChunkContext) -> str:
+        """Generate the per-chunk part of the correction prompt."""
+        error_codes = [e.error_code.value for e in chunk.errors]
+        input_text = '\n'.join(chunk.lines)
+
+        return f"""DETECTED_ISSUES: {', '.join(error_codes)}
+
+INPUT_CHUNK:
+<<<
+{input_text}
+>>>"""
+
+    def _call_llm(self, prompt: str, model: str) -> Tuple[str, Optional[List[FixSpan]]]:
+        """
+        Stream a completion, stopping as soon as a fix is bound to be rejected.
+
+        Returns:
+            Tuple of (response_text, stopped_fixes). stopped_fixes is None if
+            the stream completed, otherwise the fixes received before stopping.
+        """
+        scanner = _FixStreamScanner()
+        fixes = []
+        with self.client.chat.completions.create(**self._build_request(prompt, model),
+                                                 **self.STREAM_ARGS) as stream:
+            for event in stream:
+                if self._scan_stream_event(event, scanner, fixes):
+                    return scanner.text, fixes
+        return scanner.text, None
+
+    async def _call_llm_async(self, prompt: str, client: openai.AsyncOpenAI,
+                              model: str) -> Tuple[str, Optional[List[FixSpan]]]:
+        """Call the OpenAI API with the prompt using an async client, backing off on rate limits."""
+        request = self._build_request(prompt, model)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            try:
+                stream = await client.chat.completions.create(**request, **self.STREAM_ARGS)
+                break
+            except openai.RateLimitError:
+                if attempt == self.RATE_LIMIT_RETRIES:
+                    raise
+                delay = 2 ** attempt
+                self.logger.warning(f"Rate limited, retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+        scanner = _FixStreamScanner()
+        fixes = []
+        async with stream:
+            async for event in stream:
+                if self._scan_stream_event(event, scanner, fixes):
+                    return scanner.text, fixes
+        return scanner.text, None
+
+    def _scan_stream_event(self, event: Any, scanner: _FixStreamScanner, fixes: List[FixSpan]) -> bool:
+        """
+        Feed one streamed chunk to the scanner and check the fixes it completes.
+
+        Completed fixes are appended to fixes.
+
+        Returns:
+            True if one of them would make the whole correction fail validation
+        """
+        self._log_cache_usage(event)
+        if not event.choices or not event.choices[0].delta.content:
+            return False
+
+        for fix_data in scanner.feed(event.choices[0].delta.content):
+            try:
+                fix = FixSpan(**fix_data)
+            except (TypeError, ValueError):
+                continue  # Left for _parse_response to report
+            fixes.append(fix)
+            if not self._fix_is_safe(fix):
+                self.logger.warning("Stopping response stream early: correction will be rejected")
+                return True
+        return False
+
+    def _log_cache_usage(self, response: Any):
+        """Log how much of the prompt was served from the API's prefix cache."""
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        if details is not None:
+            self.logger.debug(f"Prompt tokens: {usage.prompt_tokens}, "
+                              f"cached: {details.cached_tokens}")
+
+    def _build_request(self, prompt: str, model: str) -> Dict[str, Any]:
+        """Build the chat completion request arguments for a prompt."""
+        messages = self._static_messages + [{"role": "user", "content": prompt}]
+
+        return {
+            "model": model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "max_tokens": 2000,
+            "response_format": {"type": "json_object"},
+            "stop": ["\n\n", "```"]
+        }
 
     def _parse_response(self, response_text: str) -> CorrectionResponse:
         """Parse LLM response into structured format."""
@@ -281,35 +769,56 @@ Output strictly as JSON matching the provided schema. No prose."""
 
     def _validate_correction(self, chunk: ChunkContext, correction: CorrectionResponse) -> bool:
         """Validate that the correction is safe to apply."""
-        for fix in correction.fixes:
-            # Check confidence threshold
-            if fix.confidence < self.min_confidence:
-                self.logger.debug(f"Fix rejected: confidence {fix.confidence} < {self.min_confidence}")
-                continue
-
-            # Check edit distance
-            edit_distance = self._calculate_edit_distance(fix.original, fix.revised)
-            if edit_distance > self.max_edit_distance:
-                self.logger.warning(f"Fix rejected: edit distance {edit_distance} > {self.max_edit_distance}")
-                return False
-
-            # Check for forbidden additions
-            if not self._check_allowed_additions(fix.original, fix.revised):
-                self.logger.warning(f"Fix rejected: contains forbidden additions")
-                return False
+        return all(self._fix_is_safe(fix) for fix in correction.fixes)
+
+    def _fix_is_safe(self, fix: FixSpan) -> bool:
+        """Check a single fix; an unsafe fix rejects the whole correction."""
+        # Check confidence threshold (low-confidence fixes are only suggestions)
+        if fix.confidence < self.min_confidence:
+            self.logger.debug(f"Fix rejected: confidence {fix.confidence} < {self.min_confidence}")
+            return True
+
+        # Check edit distance
+        edit_distance = self._calculate_edit_distance(fix.original, fix.revised)
+        if edit_distance > self.max_edit_distance:
+            self.logger.warning(f"Fix rejected: edit distance {edit_distance} > {self.max_edit_distance}")
+            return False
+
+        # Check for forbidden additions
+        if not self._check_allowed_additions(fix.original, fix.revised):
+            self.logger.warning(f"Fix rejected: contains forbidden additions")
+            return False
 
         return True
 
     def _calculate_edit_distance(self, original: List[str], revised: List[str]) -> int:
-        """Calculate simple edit distance between line lists."""
-        # Simple token-based edit distance
-        orig_tokens = set(' '.join(original).split())
-        rev_tokens = set(' '.join(revised).split())
-
-        added = rev_tokens - orig_tokens
-        removed = orig_tokens - rev_tokens
-
-        return len(added) + len(removed)
+        """Calculate the word-level Levenshtein distance between line lists."""
+        orig_words = ' '.join(original).split()
+        rev_words = ' '.join(revised).split()
+
+        # Trim the common prefix and suffix; most fixes only touch a few words
+        limit = min(len(orig_words), len(rev_words))
+        prefix = 0
+        while prefix < limit and orig_words[prefix] == rev_words[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and orig_words[-1 - suffix] == rev_words[-1 - suffix]:
+            suffix += 1
+        orig_words = orig_words[prefix:len(orig_words) - suffix]
+        rev_words = rev_words[prefix:len(rev_words) - suffix]
+
+        if not orig_words or not rev_words:
+            return len(orig_words) + len(rev_words)
+
+        previous = list(range(len(rev_words) + 1))
+        for i, orig_word in enumerate(orig_words, 1):
+            current = [i]
+            for j, rev_word in enumerate(rev_words, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (orig_word != rev_word)))
+            previous = current
+
+        return previous[-1]
 
     def _check_allowed_additions(self, original: List[str], revised: List[str]) -> bool:
         """Check that only allowed tokens were added."""
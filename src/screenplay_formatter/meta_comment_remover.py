@@ -1,7 +1,9 @@
 """Meta-comment detection and removal utility for screenplays."""
 
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Set, Tuple
 from dataclasses import dataclass
 
 from .parser import ScreenplayElement, ElementType
@@ -20,13 +22,15 @@ class RemovedComment:
 class MetaCommentRemover:
     """Remove meta-comments and production notes from spec scripts."""
 
-    # Pattern for meta-comments
-    META_COMMENT_PATTERN = re.compile(
-        r'\[(?:NOTE|TODO|FIXME|DECIDE|MAYBE|REMINDER|TBD|SHOOT|CUT|EDIT|REVIEW|CHECK|QUESTION|'
-        r'Q:|TEMP|PLACEHOLDER|TK|XXX|HACK|BUG|WARNING).*?\]',
-        re.IGNORECASE
+    # Keywords that open a bracketed meta-comment
+    META_COMMENT_KEYWORDS = (
+        r'NOTE|TODO|FIXME|DECIDE|MAYBE|REMINDER|TBD|SHOOT|CUT|EDIT|REVIEW|CHECK|QUESTION|'
+        r'Q:|TEMP|PLACEHOLDER|TK|XXX|HACK|BUG|WARNING'
     )
 
+    # Pattern for meta-comments
+    META_COMMENT_PATTERN = re.compile(r'\[(?:' + META_COMMENT_KEYWORDS + r').*?\]', re.IGNORECASE)
+
     # Additional patterns for common production notes
     PRODUCTION_NOTE_PATTERNS = [
         re.compile(r'\((?:NOTE|TODO|FIXME):[^)]+\)', re.IGNORECASE),  # (NOTE: something)
@@ -34,6 +38,22 @@ class MetaCommentRemover:
         re.compile(r'#.*?(?:\n|$)'),  # # comments (but preserve #SCENE markers in context)
     ]
 
+    # Matches the start of anything the patterns above can match, so a single
+    # scan rules out the (common) content that has no comments at all
+    COMMENT_CANDIDATE_PATTERN = re.compile(
+        r'\[(?:' + META_COMMENT_KEYWORDS + r')|\((?:NOTE|TODO|FIXME):|//|#',
+        re.IGNORECASE
+    )
+
+    # Characters a candidate can start with
+    COMMENT_START_CHARS = ('[', '(', '/', '#')
+
+    # Element types whose content may carry meta-comments
+    CLEANED_TYPES = frozenset({
+        ElementType.ACTION, ElementType.DIALOGUE,
+        ElementType.SCENE_HEADING, ElementType.PARENTHETICAL
+    })
+
     def __init__(self):
         """Initialize meta-comment remover."""
         self.removed_comments: List[RemovedComment] = []
@@ -50,12 +70,15 @@ class MetaCommentRemover:
         """
         self.removed_comments = []
         cleaned_elements = []
+        candidates = self._candidate_elements(elements)
 
-        for element in elements:
+        for index, element in enumerate(elements):
             # Only process certain element types
-            if element.type in [ElementType.ACTION, ElementType.DIALOGUE,
-                              ElementType.SCENE_HEADING, ElementType.PARENTHETICAL]:
-                cleaned_content, comments_found = self._clean_content(element.content)
+            if element.type in self.CLEANED_TYPES:
+                if index in candidates:
+                    cleaned_content, comments_found = self._clean_content(element.content)
+                else:
+                    cleaned_content, comments_found = ' '.join(element.content.split()), []
 
                 # Record removals
                 if comments_found:
@@ -69,12 +92,14 @@ class MetaCommentRemover:
                         ))
 
                 # Only keep element if it has content after cleaning
-                if cleaned_content.strip():
+                if cleaned_content and cleaned_content == element.content:
+                    cleaned_elements.append(element)
+                elif cleaned_content.strip():
                     cleaned_element = ScreenplayElement(
                         type=element.type,
                         content=cleaned_content,
                         line_number=element.line_number,
-                        raw_line=element.raw_line
+                        raw_text=element.raw_text
                     )
                     cleaned_elements.append(cleaned_element)
                 # If element is now empty, skip it (effectively removing it)
@@ -188,20 +213,53 @@ class MetaCommentRemover:
         Returns:
             True if meta-comments are found
         """
-        for element in elements:
-            if element.type in [ElementType.ACTION, ElementType.DIALOGUE,
-                              ElementType.SCENE_HEADING, ElementType.PARENTHETICAL]:
-                if self.META_COMMENT_PATTERN.search(element.content):
-                    return True
+        contents = [element.content for element in elements if element.type in self.CLEANED_TYPES]
+
+        for index in self._candidate_indices(contents):
+            content = contents[index]
+            if self.META_COMMENT_PATTERN.search(content):
+                return True
 
-                # Check other patterns
-                for pattern in self.PRODUCTION_NOTE_PATTERNS:
-                    matches = pattern.findall(element.content)
-                    if matches and not all(self._is_false_positive(m) for m in matches):
-                        return True
+            # Check other patterns
+            for pattern in self.PRODUCTION_NOTE_PATTERNS:
+                matches = pattern.findall(content)
+                if matches and not all(self._is_false_positive(m) for m in matches):
+                    return True
 
         return False
 
+    def _candidate_elements(self, elements: List[ScreenplayElement]) -> Set[int]:
+        """Indices of cleanable elements whose content may hold a comment."""
+        cleanable = [index for index, element in enumerate(elements) if element.type in self.CLEANED_TYPES]
+        contents = [elements[index].content for index in cleanable]
+        return {cleanable[i] for i in self._candidate_indices(contents)}
+
+    def _candidate_indices(self, contents: List[str]) -> List[int]:
+        """
+        Find the indices of contents that may hold a comment, in order.
+
+        All contents are searched as one newline-joined buffer. str.find
+        locates each character a comment can start with far faster than a
+        regex scan, and the candidate pattern is only tried at those spots.
+        Candidate matches never contain a newline, so none can straddle two
+        contents.
+        """
+        joined = '\n'.join(contents)
+        match = self.COMMENT_CANDIDATE_PATTERN.match
+        positions = []
+        for trigger in self.COMMENT_START_CHARS:
+            pos = joined.find(trigger)
+            while pos != -1:
+                if match(joined, pos):
+                    positions.append(pos)
+                pos = joined.find(trigger, pos + 1)
+
+        if not positions:
+            return []
+
+        starts = list(accumulate((len(content) + 1 for content in contents[:-1]), initial=0))
+        return sorted({bisect_right(starts, pos) - 1 for pos in positions})
+
     def preview_removal(self, elements: List[ScreenplayElement]) -> List[str]:
         """
         Preview what would be removed without actually modifying elements.
@@ -214,10 +272,8 @@ class MetaCommentRemover:
         """
         preview_comments = []
 
-        for element in elements:
-            if element.type in [ElementType.ACTION, ElementType.DIALOGUE,
-                              ElementType.SCENE_HEADING, ElementType.PARENTHETICAL]:
-                _, comments = self._clean_content(element.content)
-                preview_comments.extend(comments)
+        for index in sorted(self._candidate_elements(elements)):
+            _, comments = self._clean_content(elements[index].content)
+            preview_comments.extend(comments)
 
         return preview_comments
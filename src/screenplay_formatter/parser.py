@@ -1,6 +1,10 @@
 """Parser module for screenplay elements."""
 
 import re
+import hashlib
+from collections import OrderedDict
+from copy import copy
+from functools import cached_property
 from enum import Enum, auto
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
@@ -42,6 +46,16 @@ class ScreenplayElement:
     raw_text: str
     scene_number: Optional[int] = None  # For scene numbering support
 
+    @cached_property
+    def content_upper(self) -> str:
+        """Upper-cased content, computed once (content is not changed after parsing)."""
+        return self.content.upper()
+
+
+# Parsed results keyed on a content hash, shared by all parser instances
+PARSE_CACHE_SIZE = 50
+_parse_cache: "OrderedDict[bytes, List[ScreenplayElement]]" = OrderedDict()
+
 
 class ParserState:
     """Tracks parser state for context-aware parsing."""
@@ -136,6 +150,17 @@ class ScreenplayParser:
         "(V.O./CONT'D)", "(O.S./CONT'D)", "(O.C./CONT'D)"
     ]
 
+    # Element types consulted by the state machine and post-processing
+    SCENE_LEVEL_TYPES = frozenset({
+        ElementType.SCENE_HEADING, ElementType.TRANSITION, ElementType.ACTION
+    })
+    DIALOGUE_BLOCK_TYPES = frozenset({
+        ElementType.CHARACTER, ElementType.PARENTHETICAL, ElementType.DIALOGUE
+    })
+    DIALOGUE_FOLLOW_TYPES = frozenset({
+        ElementType.DIALOGUE, ElementType.PARENTHETICAL, ElementType.BLANK
+    })
+
     def __init__(self):
         self.state = ParserState()
 
@@ -144,6 +169,23 @@ class ScreenplayParser:
         if not text:
             return []
 
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        cached = _parse_cache.get(key)
+        if cached is None:
+            cached = self._parse_uncached(text)
+            _parse_cache[key] = cached
+            if len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        else:
+            _parse_cache.move_to_end(key)
+
+        # Hand out copies so callers can't alter the cached elements
+        return [copy(element) for element in cached]
+
+    def _parse_uncached(self, text: str) -> List[ScreenplayElement]:
+        """Parse text from a fresh state, bypassing the cache."""
+        self.state = ParserState()
+
         # Clean the text first to remove headers and metadata
         cleaned_text = self._clean_text(text)
         lines = cleaned_text.split('\n')
@@ -383,7 +425,7 @@ class ScreenplayParser:
     def _update_state(self, element: ScreenplayElement):
         """Update parser state based on parsed element."""
         # Exit title page mode once we hit screenplay elements
-        if element.type in [ElementType.SCENE_HEADING, ElementType.TRANSITION, ElementType.ACTION]:
+        if element.type in self.SCENE_LEVEL_TYPES:
             if element.type == ElementType.TRANSITION or element.type == ElementType.SCENE_HEADING:
                 self.state.in_title_page = False
                 self.state.screenplay_started = True
@@ -404,7 +446,7 @@ class ScreenplayParser:
             else:
                 self.state.in_dialogue_block = False
                 self.state.expecting_dialogue = False
-        elif element.type in [ElementType.ACTION, ElementType.SCENE_HEADING, ElementType.TRANSITION]:
+        elif element.type in self.SCENE_LEVEL_TYPES:
             self.state.in_dialogue_block = False
             self.state.expecting_dialogue = False
         elif element.type == ElementType.MONTAGE_BEGIN:
@@ -424,13 +466,13 @@ class ScreenplayParser:
             # Fix misidentified dialogue that should be action
             if element.type == ElementType.DIALOGUE:
                 prev_elem = elements[i-1] if i > 0 else None
-                if prev_elem and prev_elem.type not in [ElementType.CHARACTER, ElementType.PARENTHETICAL, ElementType.DIALOGUE]:
+                if prev_elem and prev_elem.type not in self.DIALOGUE_BLOCK_TYPES:
                     element.type = ElementType.ACTION
 
             # Fix character names that might be action
             if element.type == ElementType.CHARACTER:
                 next_elem = elements[i+1] if i < len(elements) - 1 else None
-                if next_elem and next_elem.type not in [ElementType.DIALOGUE, ElementType.PARENTHETICAL, ElementType.BLANK]:
+                if next_elem and next_elem.type not in self.DIALOGUE_FOLLOW_TYPES:
                     # Might be misidentified action
                     if not any(ext in element.content.upper() for ext in self.CHARACTER_EXTENSIONS):
                         element.type = ElementType.ACTION
@@ -51,6 +51,58 @@ class ValidationReport(BaseModel):
 class ScreenplayValidator:
     """Validate screenplay formatting according to industry standards."""
 
+    # Patterns are compiled once with the class rather than on every validate() call
+    SCENE_HEADING_PATTERN = re.compile(
+        r"^(INT\.|EXT\.|INT\./EXT\.|EXT\./INT\.)\s+[A-Z0-9\s\-,.'\"&()]+\s*(-\s*(DAY|NIGHT|DAWN|DUSK|MORNING|AFTERNOON|EVENING|CONTINUOUS|LATER|MOMENTS LATER|SAME)(\s*\([^)]+\))?)?$"
+    )
+
+    PARENTHETICAL_PATTERN = re.compile(r"^\([^)]+\)$")
+
+    META_COMMENT_PATTERN = re.compile(
+        r'\[(?:NOTE|TODO|FIXME|DECIDE|MAYBE|REMINDER|TBD|SHOOT|CUT|EDIT).*?\]',
+        re.IGNORECASE
+    )
+
+    # (pattern, replacement) pairs for casual text in dialogue
+    CASUAL_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in {
+            r'\bidk\b': "I don't know",
+            r'\btbh\b': "to be honest",
+            r'\blol\b': "[remove or use (laughing)]",
+            r'\bomg\b': "oh my god",
+            r'\bwtf\b': "[profanity - spell out or remove]",
+            r'\bbrb\b': "be right back",
+            r'\bbtw\b': "by the way",
+            r'\bfyi\b': "for your information",
+            r'\bimo\b': "in my opinion",
+            r'\bimho\b': "in my humble opinion"
+        }.items()
+    ]
+
+    CHARACTER_EXTENSION_PATTERN = re.compile(r'\s*\([^)]+\)\s*$')
+
+    # Patterns that indicate action rather than tone in a parenthetical
+    ACTION_INDICATOR_PATTERNS = [
+        re.compile(r'\b(walks?|runs?|sits?|stands?|enters?|exits?|grabs?|picks?|throws?)\b'),
+        re.compile(r'\b(looking|staring|glancing|watching)\b'),
+        re.compile(r'\b(long|short|brief|quick)\s+(pause|beat|stare|look|glance)\b'),
+        re.compile(r'\.\s*\.\s*\.'),  # Ellipsis in description
+        re.compile(r'\btoo\s+long\b'),
+        re.compile(r'\bfor\s+a\s+(moment|second|minute)\b')
+    ]
+
+    # Element types that may precede dialogue / parentheticals
+    DIALOGUE_BLOCK_TYPES = frozenset({
+        ElementType.CHARACTER, ElementType.PARENTHETICAL, ElementType.DIALOGUE
+    })
+    PARENTHETICAL_PRECEDING_TYPES = frozenset({ElementType.CHARACTER, ElementType.DIALOGUE})
+
+    # Element types checked for meta-comments
+    META_COMMENT_TYPES = frozenset({
+        ElementType.ACTION, ElementType.DIALOGUE, ElementType.SCENE_HEADING
+    })
+
     def __init__(self, strict_mode: bool = False):
         """
         Initialize validator.
@@ -95,10 +147,7 @@ class ScreenplayValidator:
 
     def _validate_scene_headings(self, elements: List[ScreenplayElement]):
         """Validate scene heading format per style guide."""
-        # Updated pattern to match your guide's requirements
-        scene_pattern = re.compile(
-            r"^(INT\.|EXT\.|INT\./EXT\.|EXT\./INT\.)\s+[A-Z0-9\s\-,.'\"&()]+\s*(-\s*(DAY|NIGHT|DAWN|DUSK|MORNING|AFTERNOON|EVENING|CONTINUOUS|LATER|MOMENTS LATER|SAME)(\s*\([^)]+\))?)?$"
-        )
+        scene_pattern = self.SCENE_HEADING_PATTERN
 
         for element in elements:
             if element.type == ElementType.SCENE_HEADING:
@@ -157,7 +206,7 @@ class ScreenplayValidator:
             if element.type == ElementType.DIALOGUE:
                 # Check if preceded by character or parenthetical
                 prev_element = elements[i-1] if i > 0 else None
-                if prev_element and prev_element.type not in [ElementType.CHARACTER, ElementType.PARENTHETICAL, ElementType.DIALOGUE]:
+                if prev_element and prev_element.type not in self.DIALOGUE_BLOCK_TYPES:
                     self.errors.append(ValidationError(
                         line_number=element.line_number,
                         error_code=ErrorCode.E6_INVALID_BLOCK_SEQUENCE,
@@ -169,7 +218,7 @@ class ScreenplayValidator:
 
     def _validate_parentheticals(self, elements: List[ScreenplayElement]):
         """Validate parenthetical formatting."""
-        paren_pattern = re.compile(r"^\([^)]+\)$")
+        paren_pattern = self.PARENTHETICAL_PATTERN
 
         for i, element in enumerate(elements):
             if element.type == ElementType.PARENTHETICAL:
@@ -188,7 +237,7 @@ class ScreenplayValidator:
 
                 # Check placement
                 prev_element = elements[i-1] if i > 0 else None
-                if prev_element and prev_element.type not in [ElementType.CHARACTER, ElementType.DIALOGUE]:
+                if prev_element and prev_element.type not in self.PARENTHETICAL_PRECEDING_TYPES:
                     self.errors.append(ValidationError(
                         line_number=element.line_number,
                         error_code=ErrorCode.E6_INVALID_BLOCK_SEQUENCE,
@@ -262,7 +311,7 @@ class ScreenplayValidator:
 
             # Check for orphaned dialogue
             if current.type == ElementType.DIALOGUE:
-                if previous.type not in [ElementType.CHARACTER, ElementType.PARENTHETICAL, ElementType.DIALOGUE]:
+                if previous.type not in self.DIALOGUE_BLOCK_TYPES:
                     self.errors.append(ValidationError(
                         line_number=current.line_number,
                         error_code=ErrorCode.E6_INVALID_BLOCK_SEQUENCE,
@@ -274,7 +323,7 @@ class ScreenplayValidator:
 
             # Check for orphaned parentheticals
             if current.type == ElementType.PARENTHETICAL:
-                if previous.type not in [ElementType.CHARACTER, ElementType.DIALOGUE]:
+                if previous.type not in self.PARENTHETICAL_PRECEDING_TYPES:
                     self.errors.append(ValidationError(
                         line_number=current.line_number,
                         error_code=ErrorCode.E6_INVALID_BLOCK_SEQUENCE,
@@ -356,13 +405,10 @@ class ScreenplayValidator:
 
     def _validate_meta_comments(self, elements: List[ScreenplayElement]):
         """Detect and flag meta-comments that should be removed from spec scripts."""
-        meta_comment_pattern = re.compile(
-            r'\[(?:NOTE|TODO|FIXME|DECIDE|MAYBE|REMINDER|TBD|SHOOT|CUT|EDIT).*?\]',
-            re.IGNORECASE
-        )
+        meta_comment_pattern = self.META_COMMENT_PATTERN
 
         for element in elements:
-            if element.type in [ElementType.ACTION, ElementType.DIALOGUE, ElementType.SCENE_HEADING]:
+            if element.type in self.META_COMMENT_TYPES:
                 matches = meta_comment_pattern.findall(element.content)
                 if matches:
                     suggestion = meta_comment_pattern.sub('', element.content).strip()
@@ -378,32 +424,19 @@ class ScreenplayValidator:
 
     def _validate_casual_text(self, elements: List[ScreenplayElement]):
         """Detect casual/informal text that should be expanded or formalized."""
-        casual_patterns = {
-            r'\bidk\b': "I don't know",
-            r'\btbh\b': "to be honest",
-            r'\blol\b': "[remove or use (laughing)]",
-            r'\bomg\b': "oh my god",
-            r'\bwtf\b': "[profanity - spell out or remove]",
-            r'\bbrb\b': "be right back",
-            r'\bbtw\b': "by the way",
-            r'\bfyi\b': "for your information",
-            r'\bimo\b': "in my opinion",
-            r'\bimho\b': "in my humble opinion"
-        }
-
         for element in elements:
             if element.type == ElementType.DIALOGUE:
                 content_lower = element.content.lower()
                 found_casual = []
 
-                for pattern, replacement in casual_patterns.items():
-                    if re.search(pattern, content_lower, re.IGNORECASE):
+                for pattern, replacement in self.CASUAL_PATTERNS:
+                    if pattern.search(content_lower):
                         found_casual.append((pattern, replacement))
 
                 if found_casual:
                     suggestion = element.content
                     for pattern, replacement in found_casual:
-                        suggestion = re.sub(pattern, replacement, suggestion, flags=re.IGNORECASE)
+                        suggestion = pattern.sub(replacement, suggestion)
 
                     self.errors.append(ValidationError(
                         line_number=element.line_number,
@@ -422,7 +455,7 @@ class ScreenplayValidator:
         for element in elements:
             if element.type == ElementType.CHARACTER:
                 # Extract base name (without extensions like (O.S.), (V.O.), (CONT'D))
-                base_name = re.sub(r'\s*\([^)]+\)\s*$', '', element.content).strip()
+                base_name = self.CHARACTER_EXTENSION_PATTERN.sub('', element.content).strip()
                 base_name_upper = base_name.upper()
 
                 if base_name_upper not in character_names:
@@ -506,16 +539,6 @@ class ScreenplayValidator:
 
     def _validate_misplaced_action_in_parentheticals(self, elements: List[ScreenplayElement]):
         """Detect action descriptions in parentheticals that should be action lines."""
-        # Patterns that indicate action rather than tone
-        action_indicators = [
-            r'\b(walks?|runs?|sits?|stands?|enters?|exits?|grabs?|picks?|throws?)\b',
-            r'\b(looking|staring|glancing|watching)\b',
-            r'\b(long|short|brief|quick)\s+(pause|beat|stare|look|glance)\b',
-            r'\.\s*\.\s*\.', # Ellipsis in description
-            r'\btoo\s+long\b',
-            r'\bfor\s+a\s+(moment|second|minute)\b'
-        ]
-
         for element in elements:
             if element.type == ElementType.PARENTHETICAL:
                 content_lower = element.content.lower()
@@ -534,8 +557,8 @@ class ScreenplayValidator:
                     continue
 
                 # Check for action indicators
-                for pattern in action_indicators:
-                    if re.search(pattern, content_lower):
+                for pattern in self.ACTION_INDICATOR_PATTERNS:
+                    if pattern.search(content_lower):
                         self.errors.append(ValidationError(
                             line_number=element.line_number,
                             error_code=ErrorCode.E13_MISPLACED_ACTION_IN_PAREN,
@@ -0,0 +1,41 @@
+"""Tests for the character name unifier module."""
+
+import pytest
+
+from screenplay_formatter.parser import ScreenplayElement, ElementType
+from screenplay_formatter.character_unifier import CharacterNameUnifier
+
+
+class TestCharacterNameUnifier:
+    """Test character name grouping and unification."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.unifier = CharacterNameUnifier()
+
+    @staticmethod
+    def _characters(*names):
+        return [ScreenplayElement(ElementType.CHARACTER, name, i, name)
+                for i, name in enumerate(names, 1)]
+
+    def test_unify_short_name(self):
+        """Test a shortened name unifies to the full name, keeping extensions."""
+        elements = self._characters("JESS", "JESSICA", "JESS (V.O.)")
+
+        unified = self.unifier.unify_characters(elements)
+
+        assert [e.content for e in unified] == ["JESSICA", "JESSICA", "JESSICA (V.O.)"]
+        assert self.unifier.character_map["JESSICA"].occurrences == 3
+
+    def test_grouping_is_not_transitive(self):
+        """Test names only merge with their group's canonical name, not through a shared short name."""
+        elements = self._characters("JESS", "JESSIE", "JESSICA")
+
+        character_map = self.unifier.analyze_characters(elements)
+
+        assert list(character_map) == ["JESSICA", "JESSIE"]
+        assert character_map["JESSICA"].variants == {"JESS", "JESSICA"}
+        assert character_map["JESSIE"].variants == {"JESSIE"}
+        assert [e.content for e in self.unifier.unify_characters(elements)] == [
+            "JESSICA", "JESSIE", "JESSICA"
+        ]
@@ -0,0 +1,48 @@
+"""Tests for the element diff module."""
+
+import pytest
+
+from screenplay_formatter.element_diff import diff_opcodes, REPLACE, DELETE, INSERT
+
+
+class TestElementDiff:
+    """Test Myers diff opcodes."""
+
+    def test_identical_sequences(self):
+        """Identical sequences produce no opcodes."""
+        assert diff_opcodes(['a', 'b', 'c'], ['a', 'b', 'c']) == []
+        assert diff_opcodes([], []) == []
+
+    def test_insert_does_not_misalign(self):
+        """A single inserted element is reported once, not as a cascade."""
+        a = ['a', 'b', 'c', 'd']
+        b = ['a', 'x', 'b', 'c', 'd']
+        assert diff_opcodes(a, b) == [(INSERT, 1, 1, 1, 2)]
+
+    def test_delete(self):
+        """Removed elements are reported as deletes."""
+        assert diff_opcodes(['a', 'b', 'c'], ['a', 'c']) == [(DELETE, 1, 2, 1, 1)]
+
+    def test_replace(self):
+        """Changed elements are reported as replacements."""
+        a = [('ACTION', 'She walks.'), ('CHARACTER', 'JOHN')]
+        b = [('ACTION', 'She runs.'), ('CHARACTER', 'JOHN')]
+        assert diff_opcodes(a, b) == [(REPLACE, 0, 1, 0, 1)]
+
+    def test_edit_script_reconstructs_target(self):
+        """Applying the opcodes to the first sequence yields the second."""
+        a = list('abcabba')
+        b = list('cbabac')
+        result = []
+        last = 0
+        edit_count = 0
+        for tag, i1, i2, j1, j2 in diff_opcodes(a, b):
+            result.extend(a[last:i1])
+            result.extend(b[j1:j2])
+            last = i2
+            edit_count += (i2 - i1) + (j2 - j1)
+        result.extend(a[last:])
+
+        assert result == b
+        # Minimal edit distance for the classic Myers example
+        assert edit_count == 5
@@ -5,8 +5,8 @@ import os
 import tempfile
 from pathlib import Path
 
-from screenplay_formatter.parser import ScreenplayParser, ElementType
-from screenplay_formatter.formatter import TextFormatter, DocxFormatter, PdfFormatter
+from screenplay_formatter.parser import ScreenplayParser, ScreenplayElement, ElementType
+from screenplay_formatter.formatter import TextFormatter, DocxFormatter, PdfFormatter, write_all
 
 
 class TestTextFormatter:
@@ -123,6 +123,60 @@ CUT TO:"""
         assert "This isn't working!" in content
         assert "CUT TO:" in content
 
+    def test_optimal_wrap_balances_lines(self):
+        """Test that optimal wrapping evens out line lengths within the margins."""
+        text = "JOHN\nI don't know what you want from me, but I'm not going to stand here and take it any more."
+        elements = self.parser.parse(text)
+
+        output_path = os.path.join(self.temp_dir, "test.txt")
+        TextFormatter(optimal_wrap=True).format(elements, output_path)
+
+        with open(output_path, 'r') as f:
+            dialogue = [line for line in f.read().split('\n')[1:] if line]
+
+        assert [line.strip() for line in dialogue] == [
+            "I don't know what you want from",
+            "me, but I'm not going to stand",
+            "here and take it any more.",
+        ]
+        assert all(len(line) <= 65 for line in dialogue)
+
+    def test_page_break_is_form_feed(self):
+        """Test that forced page breaks are written as a form feed line."""
+        elements = self.parser.parse("He waits.\n\n===\n\nINT. OFFICE - DAY")
+
+        output_path = os.path.join(self.temp_dir, "test.txt")
+        self.formatter.format(elements, output_path)
+
+        with open(output_path, 'r') as f:
+            lines = f.read().split('\n')
+
+        assert "\x0c" in lines
+        assert lines[lines.index("\x0c") + 1] == "INT. OFFICE - DAY"
+
+    def test_spacing_looks_past_blank_elements(self):
+        """Test that spacing depends on the next non-blank element."""
+        elements = [
+            ScreenplayElement(ElementType.ACTION, "He waits.", 1, "He waits."),
+            ScreenplayElement(ElementType.BLANK, "", 2, ""),
+            ScreenplayElement(ElementType.BLANK, "", 3, ""),
+            ScreenplayElement(ElementType.ACTION, "Still waiting.", 4, "Still waiting."),
+            ScreenplayElement(ElementType.BLANK, "", 5, ""),
+            ScreenplayElement(ElementType.CHARACTER, "JOHN", 6, "JOHN"),
+        ]
+
+        output_path = os.path.join(self.temp_dir, "test.txt")
+        self.formatter.format(elements, output_path)
+
+        with open(output_path, 'r') as f:
+            lines = f.read().split('\n')
+
+        # Consecutive action blocks are not spaced; a character name is
+        assert lines[0] == "He waits."
+        assert lines[1] == "Still waiting."
+        assert lines[2] == ""
+        assert lines[3].strip() == "JOHN"
+
 
 class TestDocxFormatter:
     """Test DOCX formatter functionality."""
@@ -221,4 +275,30 @@ This is dialogue {i}.
         self.formatter.format(elements, output_path)
 
         # Check that file was created
-        assert os.path.exists(output_path)
\ No newline at end of file
+        assert os.path.exists(output_path)
+
+
+class TestWriteAll:
+    """Test writing every output format at once."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = ScreenplayParser()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up temp files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_write_all_formats(self):
+        """Test that text, DOCX and PDF files are all written."""
+        elements = self.parser.parse("INT. OFFICE - DAY\n\nJOHN\nHello, world!")
+
+        paths = write_all(elements, os.path.join(self.temp_dir, "script"))
+
+        assert [Path(p).suffix for p in paths] == ['.txt', '.docx', '.pdf']
+        for path in paths:
+            assert os.path.getsize(path) > 0
+        with open(paths[0], 'r') as f:
+            assert "Hello, world!" in f.read()
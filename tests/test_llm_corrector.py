@@ -0,0 +1,145 @@
+"""Tests for the LLM corrector module."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from screenplay_formatter.parser import ElementType
+from screenplay_formatter.validator import ValidationError, ErrorCode
+from screenplay_formatter.llm_corrector import LLMCorrector, ChunkContext
+
+
+class TestRuleCorrection:
+    """Test chunks fixed by rules without calling the LLM."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.corrector = LLMCorrector(api_key="test-key")
+        self.corrector._call_llm = self._fail_call
+
+    @staticmethod
+    def _fail_call(prompt, model):
+        raise AssertionError("LLM should not be called")
+
+    def _chunk(self, line, error_code, element_type, suggestion, confidence=0.95):
+        error = ValidationError(
+            line_number=1,
+            error_code=error_code,
+            message="test",
+            element_type=element_type,
+            content=line,
+            suggestion=suggestion,
+            confidence=confidence
+        )
+        return ChunkContext(start_line=0, end_line=1, text_lines=[line, ""],
+                            errors=[error], elements=[], non_blank_lines=1)
+
+    def test_transition_is_applied(self):
+        """Test multi-word transitions aren't rejected as forbidden additions."""
+        chunk = self._chunk("cut to", ErrorCode.E5_INCORRECT_TRANSITION,
+                            ElementType.TRANSITION, "CUT TO:")
+
+        correction, applied = self.corrector.correct_chunk(chunk)
+
+        assert applied
+        assert correction.model == "rules"
+        assert correction.fixes[0].revised == ["CUT TO:"]
+
+    def test_long_heading_is_applied(self):
+        """Test long headings aren't rejected by the edit-distance limit."""
+        line = "int old abandoned warehouse on the east side of town - night"
+        chunk = self._chunk(line, ErrorCode.E1_INVALID_SCENE_HEADING,
+                            ElementType.SCENE_HEADING,
+                            "INT. OLD ABANDONED WAREHOUSE ON THE EAST SIDE OF TOWN - NIGHT")
+
+        correction, applied = self.corrector.correct_chunk(chunk)
+
+        assert applied
+        assert correction.model == "rules"
+        assert correction.fixes[0].revised == [
+            "INT. OLD ABANDONED WAREHOUSE ON THE EAST SIDE OF TOWN - NIGHT"
+        ]
+        assert correction.fixes[0].confidence == 0.95
+
+    def test_unchanged_suggestion_needs_llm(self):
+        """Test a suggestion equal to the line isn't counted as fixed by rules."""
+        line = "INT. CAFÉ - DAY"
+        chunk = self._chunk(line, ErrorCode.E1_INVALID_SCENE_HEADING,
+                            ElementType.SCENE_HEADING, line, confidence=0.8)
+
+        assert self.corrector._rule_correction(chunk) is None
+
+    def test_mid_line_punctuation_needs_llm(self):
+        """Test periods may only be added to the prefix or the last word."""
+        chunk = self._chunk("ext print shop day", ErrorCode.E1_INVALID_SCENE_HEADING,
+                            ElementType.SCENE_HEADING, "EXT. PRINT. SHOP DAY", confidence=0.8)
+
+        assert self.corrector._rule_correction(chunk) is None
+
+
+class _FakeStream:
+    """Streamed completion that yields its text a few characters at a time."""
+
+    def __init__(self, text):
+        self.events = [
+            SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=text[i:i + 5]))])
+            for i in range(0, len(text), 5)
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __iter__(self):
+        return iter(self.events)
+
+
+class TestStreamedCorrection:
+    """Test streamed responses that are stopped at a rejected fix."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.corrector = LLMCorrector(api_key="test-key", model="fast", strong_model="strong")
+        self.requested_models = []
+        self.corrector.client = SimpleNamespace(chat=SimpleNamespace(
+            completions=SimpleNamespace(create=self._create)))
+        error = ValidationError(1, ErrorCode.E3_INCORRECT_DIALOGUE_FORMAT, "test",
+                                ElementType.DIALOGUE, "hi there")
+        self.chunk = ChunkContext(start_line=0, end_line=0, text_lines=["hi there"],
+                                  errors=[error], elements=[], non_blank_lines=1)
+
+    def _create(self, model, **kwargs):
+        self.requested_models.append(model)
+        # The fast model adds words; the strong model only changes case
+        revised = "HELLO THERE MY FRIEND" if model == "fast" else "Hi there"
+        return _FakeStream(json.dumps({
+            "model": model,
+            "fixes": [{"start_line": 0, "end_line": 0, "original": ["hi there"],
+                       "revised": [revised], "issues": ["E3"], "confidence": 0.95}],
+            "unchanged_lines": [],
+            "notes": "test"
+        }))
+
+    def test_stopped_stream_escalates(self):
+        """Test a stopped stream goes to the strong model and isn't cached."""
+        correction, applied = self.corrector.correct_chunk(self.chunk)
+
+        assert self.requested_models == ["fast", "strong"]
+        assert applied
+        assert correction.model.startswith("strong@")
+        assert [key[0] for key in self.corrector._response_cache] == ["strong"]
+
+    def test_stopped_stream_without_strong_model(self):
+        """Test a stopped stream is rejected but keeps its fixes for dry runs and suggestions."""
+        self.corrector.strong_model = None
+
+        correction, applied = self.corrector.correct_chunk(self.chunk)
+
+        assert self.requested_models == ["fast"]
+        assert not applied
+        assert [fix.revised for fix in correction.fixes] == [["HELLO THERE MY FRIEND"]]
+        assert correction.unchanged_lines == []
+        assert not self.corrector._response_cache
@@ -0,0 +1,45 @@
+"""Tests for the meta-comment remover module."""
+
+import pytest
+
+from screenplay_formatter.parser import ScreenplayElement, ElementType
+from screenplay_formatter.meta_comment_remover import MetaCommentRemover
+
+
+class TestMetaCommentRemover:
+    """Test meta-comment removal."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.remover = MetaCommentRemover()
+        self.elements = [
+            ScreenplayElement(ElementType.SCENE_HEADING, "INT. OFFICE - DAY", 1, "INT. OFFICE - DAY"),
+            ScreenplayElement(ElementType.ACTION, "She  waits. [TODO: shoot wide?]", 2, "She waits."),
+            ScreenplayElement(ElementType.CHARACTER, "JESS", 3, "JESS"),
+            ScreenplayElement(ElementType.DIALOGUE, "[NOTE: cut this line]", 4, "[NOTE: cut this line]"),
+            ScreenplayElement(ElementType.ACTION, "#SCENE 2 // check lighting", 5, "#SCENE 2"),
+        ]
+
+    def test_remove_meta_comments(self):
+        """Test comments are stripped and emptied elements dropped."""
+        cleaned = self.remover.remove_meta_comments(self.elements)
+
+        assert [e.content for e in cleaned] == [
+            "INT. OFFICE - DAY", "She waits.", "JESS", "#SCENE 2"
+        ]
+        assert cleaned[0] is self.elements[0]
+        assert [r.line_number for r in self.remover.removed_comments] == [2, 4, 5]
+
+    def test_has_meta_comments(self):
+        """Test detection ignores scene markers."""
+        assert self.remover.has_meta_comments(self.elements)
+        assert not self.remover.has_meta_comments(self.elements[:1] + self.elements[2:3])
+        marker = ScreenplayElement(ElementType.ACTION, "#SCENE 3", 1, "#SCENE 3")
+        assert not self.remover.has_meta_comments([marker])
+
+    def test_preview_removal(self):
+        """Test preview lists comments in element order without changing anything."""
+        preview = self.remover.preview_removal(self.elements)
+
+        assert preview == ["[TODO: shoot wide?]", "[NOTE: cut this line]", "// check lighting"]
+        assert self.elements[1].content == "She  waits. [TODO: shoot wide?]"
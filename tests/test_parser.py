@@ -187,4 +187,17 @@ Different character now."""
         text = "\n\n\n"
         elements = self.parser.parse(text)
 
-        assert all(e.type == ElementType.BLANK for e in elements)
\ No newline at end of file
+        assert all(e.type == ElementType.BLANK for e in elements)
+
+    def test_repeated_parse_is_independent(self):
+        """Test that reparsing text gives the same, unshared elements."""
+        text = "INT. OFFICE - DAY\n\nJOHN\nHello there."
+        first = self.parser.parse(text)
+        first[0].type = ElementType.ACTION
+
+        second = ScreenplayParser().parse(text)
+        third = self.parser.parse(text)
+
+        assert second[0].type == ElementType.SCENE_HEADING
+        assert [(e.type, e.content) for e in second] == [(e.type, e.content) for e in third]
+        assert second[0] is not third[0]
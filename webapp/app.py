@@ -263,7 +263,8 @@ def process_with_ai(content, elements, session_id, output_formats, ai_settings):
         # Initialize fix engine
         engine = FixEngine(
             llm_corrector=corrector,
-            dry_run=ai_settings.get('dry_run', False)
+            dry_run=ai_settings.get('dry_run', False),
+            use_cache=False
         )
 
         # Run AI correction
@@ -390,16 +391,22 @@ def status():
 def cleanup_old_files():
     """Clean up old temporary files."""
     import time
-    import glob
+    from fnmatch import fnmatch
 
     temp_dir = app.config['UPLOAD_FOLDER']
     cutoff_time = time.time() - 3600  # 1 hour ago
-
-    for pattern in ['*_input.txt', '*_formatted.*', '*_audit.json', '*_all_formats.zip']:
-        for file_path in glob.glob(os.path.join(temp_dir, pattern)):
+    patterns = ['*_input.txt', '*_formatted.*', '*_audit.json', '*_all_formats.zip']
+
+    # Single directory scan instead of one glob per pattern
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            # Like glob, leave hidden files alone
+            if entry.name.startswith('.') or \
+                    not any(fnmatch(entry.name, pattern) for pattern in patterns):
+                continue
             try:
-                if os.path.getctime(file_path) < cutoff_time:
-                    os.remove(file_path)
+                if entry.is_file() and entry.stat().st_ctime < cutoff_time:
+                    os.remove(entry.path)
             except OSError:
                 pass  # Ignore errors during cleanup
 